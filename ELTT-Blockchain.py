@@ -17,8 +17,9 @@
 from __future__ import annotations
 import hashlib
 import struct
+import sys
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Sequence
 
 
 # ----------------------------------------------------------
@@ -40,7 +41,7 @@ ELTT_MAX_STAKES = 1024
 # Byte-Systeme (SI und binär) – normative Tabellen
 # ----------------------------------------------------------
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SIByteUnit:
     name: str
     symbol: str
@@ -75,7 +76,7 @@ ELTT_SI_BYTE_TABLE: List[SIByteUnit] = [
 ]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BinaryByteUnit:
     name: str
     symbol: str
@@ -135,7 +136,7 @@ class TokenKind:
     LP = "LP"
 
 
-@dataclass
+@dataclass(slots=True)
 class TokenType:
     name: str
     symbol: str
@@ -144,11 +145,11 @@ class TokenType:
     energy_binding_factor: float
 
 
-@dataclass
+@dataclass(slots=True)
 class Wallet:
     address: str
     token_count: int = 0
-    tokens: List[TokenType] = field(default_factory=list)
+    tokens: Sequence[TokenType] = field(default_factory=list)
     balances: List[float] = field(default_factory=list)
 
 
@@ -168,7 +169,7 @@ class TxKind:
     GOVERNANCE_PROPOSAL = "GOVERNANCE_PROPOSAL"
 
 
-@dataclass
+@dataclass(slots=True)
 class Transaction:
     from_address: str
     to_address: str
@@ -178,7 +179,7 @@ class Transaction:
     memo: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class Block:
     index: int
     timestamp: int
@@ -187,7 +188,7 @@ class Block:
     txs: List[Transaction] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class LiquidityPool:
     token_x_index: int
     token_y_index: int
@@ -196,7 +197,7 @@ class LiquidityPool:
     lp_token_index: int
 
 
-@dataclass
+@dataclass(slots=True)
 class StakingPosition:
     owner: str
     token_index: int
@@ -206,96 +207,141 @@ class StakingPosition:
     accumulated_rewards: float
 
 
-@dataclass
+@dataclass(slots=True)
 class Blockchain:
     blocks: List[Block] = field(default_factory=list)
     wallets: List[Wallet] = field(default_factory=list)
     token_types: List[TokenType] = field(default_factory=list)
     pools: List[LiquidityPool] = field(default_factory=list)
     stakes: List[StakingPosition] = field(default_factory=list)
+    # Adresse -> Wallet-Index (erstes Vorkommen); wird von _add_wallet gepflegt
+    # und bei direkt angehängten Wallets in _find_wallet_index nachgezogen.
+    address_index: Dict[str, int] = field(default_factory=dict, repr=False, compare=False)
 
 
 # ----------------------------------------------------------
 # Hashing und Serialisierung
 # ----------------------------------------------------------
 
+# hashlib.sha256 ist an OpenSSL gebunden, das zur Laufzeit die
+# CPU-Erweiterungen (SHA-NI, AVX2) selbst auswählt. Die Bindung auf
+# Modulebene spart lediglich die Attributsuche pro Hash-Aufruf.
+_sha256 = hashlib.sha256
+
+# Kanonischer Null-Hash (prev_hash des Genesis-Blocks).
+_ZERO_HASH = b"\x00" * 32
+
+# Vorkompilierte Struct-Formate: Header = Index, Zeitstempel, prev_hash (32 Byte),
+# TX-Anzahl; fester TX-Teil = Betrag, Token-Index, TX-Typ-Code.
+_HDR = struct.Struct("!IQ32sQ")
+_TX_FIXED = struct.Struct("!dii")
+# Letzte 8 Digest-Bytes (Offset 24) als big-endian uint64 für den Energie-Bruchteil.
+_FRAC = struct.Struct("!Q")
+
+# TX-Typ-Codes identisch zu eltt_tx_kind in ELTT-Blockchain.c.
+_TXKIND_CODE = {
+    TxKind.TRANSFER: 0,
+    TxKind.MINT: 1,
+    TxKind.BURN: 2,
+    TxKind.CREATE_TOKEN: 3,
+    TxKind.CREATE_POOL: 4,
+    TxKind.ADD_LIQUIDITY: 5,
+    TxKind.REMOVE_LIQUIDITY: 6,
+    TxKind.STAKE: 7,
+    TxKind.UNSTAKE: 8,
+    TxKind.CLAIM_REWARDS: 9,
+    TxKind.SWAP: 10,
+    TxKind.PROFILE_UPDATE: 11,
+    TxKind.GOVERNANCE_PROPOSAL: 12,
+}
+
 def _serialize_transaction(tx: Transaction) -> bytes:
-    from_bytes = tx.from_address.encode("utf-8") + b"\x00"
-    to_bytes = tx.to_address.encode("utf-8") + b"\x00"
-    memo_bytes = tx.memo.encode("utf-8") + b"\x00"
-    data = b"".join([
-        from_bytes,
-        to_bytes,
-        struct.pack("!d", float(tx.amount)),
-        struct.pack("!i", int(tx.token_index)),
-        struct.pack("!i", {
-            TxKind.TRANSFER: 0,
-            TxKind.MINT: 1,
-            TxKind.BURN: 2,
-            TxKind.CREATE_TOKEN: 3,
-            TxKind.CREATE_POOL: 4,
-            TxKind.ADD_LIQUIDITY: 5,
-            TxKind.REMOVE_LIQUIDITY: 6,
-            TxKind.STAKE: 7,
-            TxKind.UNSTAKE: 8,
-            TxKind.CLAIM_REWARDS: 9,
-            TxKind.SWAP: 10,
-            TxKind.PROFILE_UPDATE: 11,
-            TxKind.GOVERNANCE_PROPOSAL: 12,
-        }[tx.kind]),
-        memo_bytes,
-    ])
-    return data
+    # Adressen und Memo werden samt NUL-Terminator als ein String kodiert
+    # (UTF-8 bildet "\0" auf 0x00 ab): zwei encode-Aufrufe statt drei plus Join.
+    return (
+        (tx.from_address + "\0" + tx.to_address + "\0").encode("utf-8")
+        + _TX_FIXED.pack(float(tx.amount), int(tx.token_index), _TXKIND_CODE[tx.kind])
+        + (tx.memo + "\0").encode("utf-8")
+    )
 
 
 def _serialize_block_header(block: Block) -> bytes:
-    return b"".join([
-        struct.pack("!I", block.index),
-        struct.pack("!Q", block.timestamp),
-        block.prev_hash,
-        struct.pack("!Q", len(block.txs)),
-    ])
+    return _HDR.pack(block.index, block.timestamp, block.prev_hash, len(block.txs))
 
 
 def compute_block_hash(block: Block) -> bytes:
-    header = _serialize_block_header(block)
-    return hashlib.sha256(header).digest()
+    return _sha256(_serialize_block_header(block)).digest()
 
 
 # ----------------------------------------------------------
 # Energie-Formel
 # ----------------------------------------------------------
 
+def _energy_from_serialized(serialized: bytes) -> float:
+    # Fusionierter Pfad: Größe, Hash und Bruchteil in einem Durchlauf über
+    # die bereits serialisierten TX-Bytes.
+    size = len(serialized)
+    last8 = _FRAC.unpack_from(_sha256(serialized).digest(), 24)[0]
+    return (_si_byte_value_from_size(size)
+            + _binary_byte_value_from_size(size)
+            + (last8 % 1_000_000_000) / 1_000_000_000.0)
+
+
 def compute_tx_energy(tx: Transaction) -> float:
-    serialized = _serialize_transaction(tx)
-    si_value = _si_byte_value_from_size(len(serialized))
-    bin_value = _binary_byte_value_from_size(len(serialized))
-    h = hashlib.sha256(serialized).digest()
-    last8 = int.from_bytes(h[24:32], "big")
-    frac = (last8 % 1_000_000_000) / 1_000_000_000.0
-    return si_value + bin_value + frac
+    return _energy_from_serialized(_serialize_transaction(tx))
+
+
+def compute_tx_energy_batch(txs: Iterable[Transaction]) -> List[float]:
+    # Blockweise Energieberechnung: identische Formel wie compute_tx_energy,
+    # jedoch mit lokal gebundenen Funktionen, um den Aufruf-Overhead pro TX
+    # innerhalb eines Blocks (bis ELTT_MAX_TX_PER_BLOCK) zu vermeiden.
+    serialize = _serialize_transaction
+    energy = _energy_from_serialized
+    return [energy(serialize(tx)) for tx in txs]
 
 
 # ----------------------------------------------------------
 # Wallet- und Token-Logik
 # ----------------------------------------------------------
 
-def _find_wallet_index(bc: Blockchain, address: str) -> int:
+def _rebuild_address_index(bc: Blockchain) -> None:
+    index = bc.address_index
+    index.clear()
     for i, w in enumerate(bc.wallets):
+        index.setdefault(w.address, i)
+
+
+def _find_wallet_index(bc: Blockchain, address: str) -> int:
+    # Treffer werden gegen bc.wallets geprüft; ein Fehlschlag fällt auf die
+    # lineare Suche zurück (Kosten wie bisher). Ersetzte oder umsortierte
+    # Wallet-Listen, auch gleicher Länge, führen so zum Neuaufbau des Index.
+    wallets = bc.wallets
+    idx = bc.address_index.get(address, -1)
+    if 0 <= idx < len(wallets) and wallets[idx].address == address:
+        return idx
+    for i, w in enumerate(wallets):
         if w.address == address:
+            _rebuild_address_index(bc)
             return i
+    if idx >= 0:
+        _rebuild_address_index(bc)
     return -1
 
 
 def _add_wallet(bc: Blockchain, address: str) -> int:
     if len(bc.wallets) >= ELTT_MAX_WALLETS:
         return -1
+    # Nur echte str sind internierbar; Unterklassen bleiben unverändert.
+    if type(address) is str:
+        address = sys.intern(address)
     w = Wallet(address=address)
     w.token_count = len(bc.token_types)
-    w.tokens = list(bc.token_types)
-    w.balances = [0.0 for _ in range(len(bc.token_types))]
+    w.tokens = tuple(bc.token_types)
+    w.balances = [0.0] * len(bc.token_types)
     bc.wallets.append(w)
-    return len(bc.wallets) - 1
+    idx = len(bc.wallets) - 1
+    bc.address_index.setdefault(address, idx)
+    return idx
 
 
 def _find_or_create_wallet(bc: Blockchain, address: str) -> int:
@@ -320,48 +366,63 @@ def add_token_type(bc: Blockchain,
         kind=kind,
         energy_binding_factor=energy_binding_factor,
     )
-    bc.token_types.append(t)
+    token_types = bc.token_types
+    token_types.append(t)
+    count = len(token_types)
+    # Alle Wallets teilen ein unveränderliches Tupel der Token-Typen; es wird
+    # je neuem Token einmal ersetzt, bc.token_types bleibt vor Wallets geschützt.
+    shared = tuple(token_types)
     for w in bc.wallets:
-        w.tokens = list(bc.token_types)
+        w.tokens = shared
         w.balances.append(0.0)
-        w.token_count = len(bc.token_types)
-    return len(bc.token_types) - 1
+        w.token_count = count
+    return count - 1
 
 
 # ----------------------------------------------------------
 # Transaktionsvalidierung und Anwendung
 # ----------------------------------------------------------
 
-def _validate_transaction(bc: Blockchain, tx: Transaction) -> bool:
-    if tx.token_index < 0 or tx.token_index >= len(bc.token_types):
+# Validierungsregel je TxKind, paritätisch zu
+# eltt_validate_transaction: DEBIT prüft Sender und Deckung, MINT den Empfänger.
+_TX_RULE_NONE = 0
+_TX_RULE_DEBIT = 1
+_TX_RULE_MINT = 2
+
+_TX_RULES = {
+    TxKind.TRANSFER: _TX_RULE_DEBIT,
+    TxKind.SWAP: _TX_RULE_DEBIT,
+    TxKind.STAKE: _TX_RULE_DEBIT,
+    TxKind.BURN: _TX_RULE_DEBIT,
+    TxKind.MINT: _TX_RULE_MINT,
+}
+
+
+def _validate_transaction(bc: Blockchain, tx: Transaction, token_count: int = -1) -> bool:
+    # token_count: von _validate_block einmal je Block vorberechnet (-1 = hier ermitteln).
+    if token_count < 0:
+        token_count = len(bc.token_types)
+    tok = tx.token_index
+    amount = tx.amount
+    if tok < 0 or tok >= token_count:
         return False
-    if tx.amount < 0.0:
+    if amount < 0.0:
         return False
 
-    from_idx = _find_wallet_index(bc, tx.from_address)
-    to_idx = _find_wallet_index(bc, tx.to_address)
-
-    if tx.kind in (TxKind.TRANSFER, TxKind.SWAP, TxKind.STAKE):
+    rule = _TX_RULES.get(tx.kind, _TX_RULE_NONE)
+    if rule == _TX_RULE_DEBIT:
+        from_idx = _find_wallet_index(bc, tx.from_address)
         if from_idx < 0:
             return False
-        if bc.wallets[from_idx].balances[tx.token_index] < tx.amount:
-            return False
-        if tx.amount <= 0.0:
-            return False
-    elif tx.kind == TxKind.MINT:
-        if to_idx < 0:
+        if bc.wallets[from_idx].balances[tok] < amount:
             return False
-        if tx.amount <= 0.0:
+        if amount <= 0.0:
             return False
-    elif tx.kind == TxKind.BURN:
-        if from_idx < 0:
-            return False
-        if bc.wallets[from_idx].balances[tx.token_index] < tx.amount:
+    elif rule == _TX_RULE_MINT:
+        if _find_wallet_index(bc, tx.to_address) < 0:
             return False
-        if tx.amount <= 0.0:
+        if amount <= 0.0:
             return False
-    else:
-        pass
 
     return True
 
@@ -370,15 +431,24 @@ def _apply_transaction(bc: Blockchain, tx: Transaction) -> None:
     from_idx = _find_or_create_wallet(bc, tx.from_address)
     to_idx = _find_or_create_wallet(bc, tx.to_address)
 
-    if tx.kind in (TxKind.TRANSFER, TxKind.SWAP):
-        bc.wallets[from_idx].balances[tx.token_index] -= tx.amount
-        bc.wallets[to_idx].balances[tx.token_index] += tx.amount
-    elif tx.kind == TxKind.MINT:
-        bc.wallets[to_idx].balances[tx.token_index] += tx.amount
-    elif tx.kind == TxKind.BURN:
-        bc.wallets[from_idx].balances[tx.token_index] -= tx.amount
-    else:
-        pass
+    # Kind, Token-Index und Betrag einmal gelesen statt je Zweig über tx.*.
+    wallets = bc.wallets
+    kind = tx.kind
+    tok = tx.token_index
+    amount = tx.amount
+    if kind == TxKind.TRANSFER or kind == TxKind.SWAP:
+        wallets[from_idx].balances[tok] -= amount
+        wallets[to_idx].balances[tok] += amount
+    elif kind == TxKind.MINT:
+        wallets[to_idx].balances[tok] += amount
+    elif kind == TxKind.BURN:
+        wallets[from_idx].balances[tok] -= amount
+
+
+def _apply_block_transactions(bc: Blockchain, txs: List[Transaction]) -> None:
+    apply_tx = _apply_transaction
+    for tx in txs:
+        apply_tx(bc, tx)
 
 
 # ----------------------------------------------------------
@@ -387,7 +457,7 @@ def _apply_transaction(bc: Blockchain, tx: Transaction) -> None:
 
 def _validate_block(bc: Blockchain, block: Block) -> bool:
     if block.index == 0:
-        if block.prev_hash != b"\x00" * 32:
+        if block.prev_hash != _ZERO_HASH:
             return False
     else:
         if not bc.blocks:
@@ -398,19 +468,15 @@ def _validate_block(bc: Blockchain, block: Block) -> bool:
         if block.prev_hash != prev.hash:
             return False
 
-    tmp = Block(
-        index=block.index,
-        timestamp=block.timestamp,
-        prev_hash=block.prev_hash,
-        hash=b"",
-        txs=list(block.txs),
-    )
-    tmp.hash = compute_block_hash(tmp)
-    if tmp.hash != block.hash:
+    # Der Header hängt nur von Index, Zeitstempel, prev_hash und TX-Anzahl ab;
+    # der Hash wird direkt aus dem eingehenden Block berechnet (keine Kopie).
+    if compute_block_hash(block) != block.hash:
         return False
 
+    validate_tx = _validate_transaction
+    token_count = len(bc.token_types)
     for tx in block.txs:
-        if not _validate_transaction(bc, tx):
+        if not validate_tx(bc, tx, token_count):
             return False
 
     return True
@@ -420,8 +486,7 @@ def append_block(bc: Blockchain, block: Block) -> bool:
     if not _validate_block(bc, block):
         return False
     bc.blocks.append(block)
-    for tx in block.txs:
-        _apply_transaction(bc, tx)
+    _apply_block_transactions(bc, block.txs)
     return True
 
 
@@ -438,11 +503,10 @@ def init_blockchain() -> Blockchain:
 
 
 def build_genesis_block(owner_address: str, timestamp: int) -> Block:
-    prev_hash = b"\x00" * 32
     block = Block(
         index=0,
         timestamp=timestamp,
-        prev_hash=prev_hash,
+        prev_hash=_ZERO_HASH,
         hash=b"",
         txs=[],
     )
@@ -473,5 +537,6 @@ __all__ = [
     "create_genesis",
     "append_block",
     "compute_tx_energy",
+    "compute_tx_energy_batch",
     "compute_block_hash",
 ]
@@ -24,7 +24,8 @@ Matrix-Rolle:
 """
 
 from dataclasses import dataclass
-from typing import List, Dict, Any, Optional, Tuple
+from operator import itemgetter
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 
 
 # ---------------------------------------------------------------------------
@@ -85,6 +86,19 @@ class StakingPositionView:
     status: str  # z.B. "active", "unlocking", "closed"
 
 
+# Pflichtfelder der Rohdaten in Konstruktor-Reihenfolge der Views; ein
+# itemgetter-Aufruf liest alle Schlüssel eines Datensatzes auf C-Ebene.
+_BLOCK_FIELDS = itemgetter("height", "hash", "previous_hash", "timestamp", "tx_count")
+_TX_FIELDS = itemgetter("tx_id", "from", "to", "amount", "token_symbol", "timestamp")
+_POOL_FIELDS = itemgetter(
+    "pool_id", "token_a", "token_b", "reserve_a", "reserve_b", "total_lp_tokens", "fee_bps"
+)
+_STAKING_FIELDS = itemgetter(
+    "position_id", "staker_address", "staked_amount", "token_symbol",
+    "lock_until", "pending_rewards", "status",
+)
+
+
 # ---------------------------------------------------------------------------
 # Schnittstellen-Adapter (lesend) zur Engine / Blockchain / Pools / Staking
 # ---------------------------------------------------------------------------
@@ -111,52 +125,31 @@ class EngineReader:
 
     def get_latest_blocks(self, limit: int = 20) -> List[BlockView]:
         """Liest die letzten N Blöcke aus der Engine (rein lesend)."""
+        return list(self.iter_latest_blocks(limit=limit))
+
+    def iter_latest_blocks(self, limit: int = 20) -> Iterator[BlockView]:
+        """Wie get_latest_blocks, erzeugt die BlockViews jedoch erst beim Iterieren."""
         raw_blocks = self._engine_client.fetch_latest_blocks(limit=limit)
-        return [
-            BlockView(
-                height=b["height"],
-                hash=b["hash"],
-                previous_hash=b["previous_hash"],
-                timestamp=b["timestamp"],
-                tx_count=b["tx_count"],
-                producer=b.get("producer", "unknown"),
-            )
-            for b in raw_blocks
-        ]
+        fields = _BLOCK_FIELDS
+        return (BlockView(*fields(b), b.get("producer", "unknown")) for b in raw_blocks)
 
     def get_block_by_height(self, height: int) -> Optional[BlockView]:
         """Liest einen Block anhand seiner Höhe (rein lesend)."""
         raw = self._engine_client.fetch_block_by_height(height)
         if raw is None:
             return None
-        return BlockView(
-            height=raw["height"],
-            hash=raw["hash"],
-            previous_hash=raw["previous_hash"],
-            timestamp=raw["timestamp"],
-            tx_count=raw["tx_count"],
-            producer=raw.get("producer", "unknown"),
-        )
+        return BlockView(*_BLOCK_FIELDS(raw), raw.get("producer", "unknown"))
 
     def get_transactions_for_block(self, block_hash: str) -> List[TransactionView]:
         """Liest alle Transaktionen eines Blocks (rein lesend)."""
         raw_txs = self._engine_client.fetch_transactions_by_block_hash(block_hash)
-        return [
-            TransactionView(
-                tx_id=t["tx_id"],
-                from_address=t["from"],
-                to_address=t["to"],
-                amount=t["amount"],
-                token_symbol=t["token_symbol"],
-                timestamp=t["timestamp"],
-                status=t.get("status", "confirmed"),
-            )
-            for t in raw_txs
-        ]
+        fields = _TX_FIELDS
+        return [TransactionView(*fields(t), t.get("status", "confirmed")) for t in raw_txs]
 
     def get_wallet_balances(self, address: str) -> WalletBalanceView:
         """Liest die Balances eines Wallets (rein lesend)."""
         raw_balances = self._engine_client.fetch_wallet_balances(address)
+        # Eigene Kopie: die Sicht bleibt stabil, auch wenn der Client sein dict ändert.
         return WalletBalanceView(
             address=address,
             balances=dict(raw_balances),
@@ -175,33 +168,15 @@ class PoolsReader:
     def list_pools(self) -> List[PoolView]:
         """Liest alle Pools (rein lesend)."""
         raw_pools = self._pools_client.fetch_all_pools()
-        return [
-            PoolView(
-                pool_id=p["pool_id"],
-                token_a=p["token_a"],
-                token_b=p["token_b"],
-                reserve_a=p["reserve_a"],
-                reserve_b=p["reserve_b"],
-                total_lp_tokens=p["total_lp_tokens"],
-                fee_bps=p["fee_bps"],
-            )
-            for p in raw_pools
-        ]
+        fields = _POOL_FIELDS
+        return [PoolView(*fields(p)) for p in raw_pools]
 
     def get_pool(self, pool_id: str) -> Optional[PoolView]:
         """Liest einen spezifischen Pool (rein lesend)."""
         raw = self._pools_client.fetch_pool(pool_id)
         if raw is None:
             return None
-        return PoolView(
-                pool_id=raw["pool_id"],
-                token_a=raw["token_a"],
-                token_b=raw["token_b"],
-                reserve_a=raw["reserve_a"],
-                reserve_b=raw["reserve_b"],
-                total_lp_tokens=raw["total_lp_tokens"],
-                fee_bps=raw["fee_bps"],
-        )
+        return PoolView(*_POOL_FIELDS(raw))
 
 
 class StakingReader:
@@ -216,33 +191,15 @@ class StakingReader:
     def list_positions_for_address(self, address: str) -> List[StakingPositionView]:
         """Liest alle Staking-Positionen eines Adressaten (rein lesend)."""
         raw_positions = self._staking_client.fetch_positions_by_address(address)
-        return [
-            StakingPositionView(
-                position_id=p["position_id"],
-                staker_address=p["staker_address"],
-                staked_amount=p["staked_amount"],
-                token_symbol=p["token_symbol"],
-                lock_until=p["lock_until"],
-                pending_rewards=p["pending_rewards"],
-                status=p["status"],
-            )
-            for p in raw_positions
-        ]
+        fields = _STAKING_FIELDS
+        return [StakingPositionView(*fields(p)) for p in raw_positions]
 
     def get_position(self, position_id: str) -> Optional[StakingPositionView]:
         """Liest eine spezifische Staking-Position (rein lesend)."""
         raw = self._staking_client.fetch_position(position_id)
         if raw is None:
             return None
-        return StakingPositionView(
-            position_id=raw["position_id"],
-            staker_address=raw["staker_address"],
-            staked_amount=raw["staked_amount"],
-            token_symbol=raw["token_symbol"],
-            lock_until=raw["lock_until"],
-            pending_rewards=raw["pending_rewards"],
-            status=raw["status"],
-        )
+        return StakingPositionView(*_STAKING_FIELDS(raw))
 
 
 # ---------------------------------------------------------------------------
@@ -300,7 +257,8 @@ def build_block_explorer_view(
 
     Keine Mutationen, keine Schreibzugriffe.
     """
-    blocks = engine_reader.get_latest_blocks(limit=limit)
+    # BlockViews entstehen direkt beim Aufbau der Liste, ohne Zwischenliste.
+    blocks = engine_reader.iter_latest_blocks(limit=limit)
     return {
         "blocks": [
             {
@@ -109,20 +109,26 @@ class WalletReader:
             return 0
 
     def list_recent_transactions(self, address: str, limit: int = 50) -> List[WalletTransactionView]:
-        raw_txs = list(self._engine.fetch_transactions_for_address(address, limit=limit))
+        raw_txs = self._engine.fetch_transactions_for_address(address, limit=limit)
+        # Fallback-Zeitstempel einmal pro Aufruf statt pro Zeile; .get je Zeile gebunden.
+        now = time.time()
         txs: List[WalletTransactionView] = []
+        append = txs.append
         for t in raw_txs:
-            txs.append(
+            get = t.get
+            fee = get("fee")
+            block_height = get("block_height")
+            append(
                 WalletTransactionView(
-                    tx_id=str(t.get("tx_id", "")),
-                    timestamp=float(t.get("timestamp", time.time())),
-                    from_address=str(t.get("from", "")),
-                    to_address=str(t.get("to", "")),
-                    amount=float(t.get("amount", 0.0)),
-                    token_symbol=str(t.get("token_symbol", "ELTT")),
-                    fee=(float(t.get("fee")) if t.get("fee") is not None else None),
-                    status=str(t.get("status", "confirmed")),
-                    block_height=(int(t.get("block_height")) if t.get("block_height") is not None else None),
+                    tx_id=str(get("tx_id", "")),
+                    timestamp=float(get("timestamp", now)),
+                    from_address=str(get("from", "")),
+                    to_address=str(get("to", "")),
+                    amount=float(get("amount", 0.0)),
+                    token_symbol=str(get("token_symbol", "ELTT")),
+                    fee=(float(fee) if fee is not None else None),
+                    status=str(get("status", "confirmed")),
+                    block_height=(int(block_height) if block_height is not None else None),
                 )
             )
         return txs
@@ -23,6 +23,7 @@ from ELTT-Blockchain import (  # type: ignore
     create_genesis,
     append_block,
     compute_tx_energy,
+    compute_tx_energy_batch,
     compute_block_hash,
 )
 
@@ -40,5 +41,6 @@ __all__ = [
     "create_genesis",
     "append_block",
     "compute_tx_energy",
+    "compute_tx_energy_batch",
     "compute_block_hash",
 ]
@@ -17,6 +17,8 @@ from ELTT-Blockchain import (  # type: ignore
     compute_tx_energy,
 )
 
+from typing import Iterable, List
+
 
 def create_pool(bc: Blockchain,
                 token_x_index: int,
@@ -46,9 +48,13 @@ def add_liquidity(bc: Blockchain,
     Die tatsächliche Token-Übertragung erfolgt über Transaktionen
     in der zentralen Blockchain-Logik.
     """
-    if pool_index < 0 or pool_index >= len(bc.pools):
+    # Negative Indizes würden von Python umgebrochen; die Obergrenze prüft der Zugriff.
+    if pool_index < 0:
+        return
+    try:
+        pool = bc.pools[pool_index]
+    except IndexError:
         return
-    pool = bc.pools[pool_index]
     pool.reserve_x += amount_x
     pool.reserve_y += amount_y
 
@@ -60,15 +66,60 @@ def remove_liquidity(bc: Blockchain,
     """
     Deterministisches Entfernen von Liquidität aus einem Pool.
     """
-    if pool_index < 0 or pool_index >= len(bc.pools):
+    # Negative Indizes würden von Python umgebrochen; die Obergrenze prüft der Zugriff.
+    if pool_index < 0:
         return
-    pool = bc.pools[pool_index]
-    pool.reserve_x -= share_x
-    pool.reserve_y -= share_y
-    if pool.reserve_x < 0.0:
-        pool.reserve_x = 0.0
-    if pool.reserve_y < 0.0:
-        pool.reserve_y = 0.0
+    try:
+        pool = bc.pools[pool_index]
+    except IndexError:
+        return
+    # Untergrenze 0.0 auf lokalen Werten, je Reserve genau ein Attribut-Schreibzugriff.
+    reserve_x = pool.reserve_x - share_x
+    reserve_y = pool.reserve_y - share_y
+    pool.reserve_x = 0.0 if reserve_x < 0.0 else reserve_x
+    pool.reserve_y = 0.0 if reserve_y < 0.0 else reserve_y
+
+
+def add_liquidity_batch(bc: Blockchain,
+                        pool_indices: Iterable[int],
+                        amounts_x: Iterable[float],
+                        amounts_y: Iterable[float]) -> None:
+    """
+    Wendet add_liquidity für eine Folge von Ereignissen in Reihenfolge an.
+    Pool-Liste und Grenzen werden nur einmal pro Batch gebunden.
+    Ungleich lange Folgen lösen ValueError aus, bevor ein Pool verändert wird.
+    """
+    events = list(zip(pool_indices, amounts_x, amounts_y, strict=True))
+    pools = bc.pools
+    n = len(pools)
+    for pool_index, amount_x, amount_y in events:
+        if pool_index < 0 or pool_index >= n:
+            continue
+        pool = pools[pool_index]
+        pool.reserve_x += amount_x
+        pool.reserve_y += amount_y
+
+
+def remove_liquidity_batch(bc: Blockchain,
+                           pool_indices: Iterable[int],
+                           shares_x: Iterable[float],
+                           shares_y: Iterable[float]) -> None:
+    """
+    Wendet remove_liquidity für eine Folge von Ereignissen in Reihenfolge an
+    (Untergrenze 0.0 nach jedem Ereignis, wie im Einzelaufruf).
+    Ungleich lange Folgen lösen ValueError aus, bevor ein Pool verändert wird.
+    """
+    events = list(zip(pool_indices, shares_x, shares_y, strict=True))
+    pools = bc.pools
+    n = len(pools)
+    for pool_index, share_x, share_y in events:
+        if pool_index < 0 or pool_index >= n:
+            continue
+        pool = pools[pool_index]
+        reserve_x = pool.reserve_x - share_x
+        reserve_y = pool.reserve_y - share_y
+        pool.reserve_x = 0.0 if reserve_x < 0.0 else reserve_x
+        pool.reserve_y = 0.0 if reserve_y < 0.0 else reserve_y
 
 
 def build_swap_tx(from_address: str,
@@ -93,6 +144,29 @@ def build_swap_tx(from_address: str,
     )
 
 
+def build_swap_tx_batch(from_addresses: Iterable[str],
+                        to_addresses: Iterable[str],
+                        amounts_in: Iterable[float],
+                        token_in_indices: Iterable[int],
+                        token_out_indices: Iterable[int],
+                        memo: str = "") -> List[Transaction]:
+    """
+    Deterministische Erstellung einer Folge von Swap-Transaktionen
+    (ein gemeinsames Memo, einmalig gekürzt). Wie bei build_swap_tx
+    gehen die Ziel-Token-Indizes nicht in die Transaktion ein, ihre
+    Anzahl muss aber passen: ungleich lange Folgen lösen ValueError aus.
+    """
+    tx_type = Transaction
+    kind = TxKind.SWAP
+    memo = memo[:128]
+    return [
+        tx_type(from_address, to_address, amount_in, token_in_index, kind, memo)
+        for from_address, to_address, amount_in, token_in_index, _token_out_index
+        in zip(from_addresses, to_addresses, amounts_in, token_in_indices,
+               token_out_indices, strict=True)
+    ]
+
+
 __all__ = [
     "Blockchain",
     "Transaction",
@@ -104,5 +178,8 @@ __all__ = [
     "create_pool",
     "add_liquidity",
     "remove_liquidity",
+    "add_liquidity_batch",
+    "remove_liquidity_batch",
     "build_swap_tx",
+    "build_swap_tx_batch",
 ]
@@ -18,44 +18,41 @@ from ELTT-Blockchain import (  # type: ignore
     create_genesis,
     append_block,
     compute_tx_energy,
+    _find_wallet_index,
+    _find_or_create_wallet,
 )
 
 
-def create_wallet(bc: Blockchain, address: str) -> Wallet:
+def create_wallet(bc: Blockchain, address: str) -> Wallet | None:
     """
     Deterministische Wallet-Erstellung.
     Die Ableitung der Adresse aus der 12-Wort-Phrase erfolgt ausschließlich im Frontend.
     Diese Funktion stellt nur sicher, dass eine Wallet-Struktur im Blockchain-Zustand existiert.
+    Nutzt _find_or_create_wallet der zentralen Implementierung; None, wenn
+    ELTT_MAX_WALLETS erreicht ist.
     """
-    for w in bc.wallets:
-        if w.address == address:
-            return w
-    w = Wallet(address=address)
-    w.token_count = len(bc.token_types)
-    w.tokens = list(bc.token_types)
-    w.balances = [0.0 for _ in range(len(bc.token_types))]
-    bc.wallets.append(w)
-    return w
+    idx = _find_or_create_wallet(bc, address)
+    if idx < 0:
+        return None
+    return bc.wallets[idx]
 
 
 def get_wallet(bc: Blockchain, address: str) -> Wallet | None:
     """
-    Deterministischer Zugriff auf eine Wallet.
+    Deterministischer Zugriff auf eine Wallet: Treffer über bc.address_index,
+    sonst lineare Suche wie in der zentralen Implementierung.
     """
-    for w in bc.wallets:
-        if w.address == address:
-            return w
-    return None
+    idx = _find_wallet_index(bc, address)
+    if idx < 0:
+        return None
+    return bc.wallets[idx]
 
 
 def list_wallet_tokens(wallet: Wallet) -> list[tuple[TokenType, float]]:
     """
     Deterministische Auflistung aller Token-Bestände einer Wallet.
     """
-    result: list[tuple[TokenType, float]] = []
-    for t, bal in zip(wallet.tokens, wallet.balances):
-        result.append((t, bal))
-    return result
+    return list(zip(wallet.tokens, wallet.balances))
 
 
 def build_transfer_tx(from_address: str,
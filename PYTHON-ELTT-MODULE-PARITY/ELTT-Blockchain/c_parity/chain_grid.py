@@ -10,14 +10,15 @@ Parität zu: eltt_viewer_build_chain_grid in ELTT-Viewer.c
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, List, Mapping, Sequence, Dict
+from operator import attrgetter
+from typing import Any, Dict, Iterator, List, Mapping, Sequence
 
 
 # ---------------------------------------------------------------------------
 # Datentypen – Parität zu eltt_chain_grid_entry
 # ---------------------------------------------------------------------------
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ChainGridEntry:
     index: int          # uint32
     timestamp: int      # uint64
@@ -30,15 +31,38 @@ class ChainGridEntry:
         JSON-kompatible Darstellung:
         - hash / prev_hash als hex-String
         """
+        cache = _HEX_CACHE
+        try:
+            hash_hex = cache[self.hash]
+        except KeyError:
+            hash_hex = _hex_miss(self.hash)
+        try:
+            prev_hex = cache[self.prev_hash]
+        except KeyError:
+            prev_hex = _hex_miss(self.prev_hash)
         return {
             "index": self.index,
             "timestamp": self.timestamp,
-            "hash": self.hash.hex(),
-            "prev_hash": self.prev_hash.hex(),
+            "hash": hash_hex,
+            "prev_hash": prev_hex,
             "tx_count": self.tx_count,
         }
 
 
+# Hex-Strings bereits gesehener Hashes: Blöcke sind unveränderlich, und
+# prev_hash eines Blocks ist hash seines Vorgängers – jeder Hash wird so über
+# alle Snapshots hinweg nur einmal hexkodiert. Begrenzt durch Leeren bei Überlauf.
+_HEX_CACHE_MAX = 4096
+_HEX_CACHE: Dict[bytes, str] = {}
+
+
+def _hex_miss(h: bytes) -> str:
+    if len(_HEX_CACHE) >= _HEX_CACHE_MAX:
+        _HEX_CACHE.clear()
+    value = _HEX_CACHE[h] = h.hex()
+    return value
+
+
 # ---------------------------------------------------------------------------
 # Erwartete Blockchain-Schnittstelle (read-only)
 # ---------------------------------------------------------------------------
@@ -53,6 +77,25 @@ class ChainGridEntry:
 #
 # Es werden ausschließlich Lesezugriffe durchgeführt.
 
+# Pflichtattribute in einem C-Level-Aufruf; `txs` bleibt optional (getattr-Default).
+_BLOCK_REQUIRED = attrgetter("index", "timestamp", "hash", "prev_hash")
+
+
+def _chain_grid_entry(b: Any) -> ChainGridEntry:
+    index, timestamp, block_hash, prev_hash = _BLOCK_REQUIRED(b)
+    # bytes sind unveränderlich: vorhandene Objekte werden ohne Kopie übernommen.
+    if type(block_hash) is not bytes:
+        block_hash = bytes(block_hash)
+    if type(prev_hash) is not bytes:
+        prev_hash = bytes(prev_hash)
+    return ChainGridEntry(
+        int(index),
+        int(timestamp),
+        block_hash,
+        prev_hash,
+        len(getattr(b, "txs", ())),
+    )
+
 
 def build_chain_grid(blockchain: Any, max_entries: int) -> List[ChainGridEntry]:
     """
@@ -72,17 +115,11 @@ def build_chain_grid(blockchain: Any, max_entries: int) -> List[ChainGridEntry]:
     blocks: Sequence[Any] = getattr(blockchain, "blocks", [])
     count = min(len(blocks), max_entries)
 
-    entries: List[ChainGridEntry] = []
+    make = _chain_grid_entry
+    # Länge ist vorab bekannt: Liste einmalig anlegen statt per append wachsen lassen.
+    entries: List[ChainGridEntry] = [None] * count  # type: ignore[list-item]
     for i in range(count):
-        b = blocks[i]
-        entry = ChainGridEntry(
-            index=int(getattr(b, "index")),
-            timestamp=int(getattr(b, "timestamp")),
-            hash=bytes(getattr(b, "hash")),
-            prev_hash=bytes(getattr(b, "prev_hash")),
-            tx_count=len(getattr(b, "txs", [])),
-        )
-        entries.append(entry)
+        entries[i] = make(blocks[i])
 
     return entries
 
@@ -93,3 +130,17 @@ def build_chain_grid_json(blockchain: Any, max_entries: int) -> List[Mapping[str
     Gibt eine Liste von Dicts zurück, direkt serialisierbar mit json.dumps().
     """
     return [entry.to_json() for entry in build_chain_grid(blockchain, max_entries)]
+
+
+def iter_chain_grid_json(
+    blockchain: Any,
+    max_entries: int,
+) -> Iterator[Mapping[str, Any]]:
+    """
+    Wie build_chain_grid_json, liest jeden Block jedoch erst beim Iterieren
+    (für streamende Serialisierung ohne Zwischenliste).
+    """
+    blocks: Sequence[Any] = getattr(blockchain, "blocks", [])
+    make = _chain_grid_entry
+    for i in range(min(len(blocks), max_entries)):
+        yield make(blocks[i]).to_json()
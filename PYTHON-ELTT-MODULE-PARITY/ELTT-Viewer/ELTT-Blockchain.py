@@ -12,9 +12,10 @@ from dataclasses import dataclass
 from typing import Any, Dict, List, Mapping
 
 from c_parity.chaingrid import build_chain_grid_json
+from c_parity.portfolio_cache import cached_sub_view
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BlockchainViewerSnapshot:
     """
     JSON-kompatible Spiegelung der Blockchain-Sicht aus Perspektive des ELTT-Viewer-Moduls.
@@ -35,7 +36,7 @@ def build_blockchain_viewer_snapshot(
     Erzeugt einen reinen Lese-Snapshot der Blockchain-Sicht.
     Parität zur Struktur von ELTT-Viewer.c / ELTT-Viewer.json.
     """
-    chains_json = build_chain_grid_json(portfolio, max_chains)
+    chains_json = cached_sub_view(build_chain_grid_json, portfolio, max_chains)
 
     return BlockchainViewerSnapshot(
         chains=chains_json,
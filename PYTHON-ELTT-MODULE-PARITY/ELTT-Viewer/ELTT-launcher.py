@@ -13,9 +13,10 @@ from typing import Any, Dict, List, Mapping
 
 from c_parity.tokens_positions import build_token_positions_json
 from c_parity.lp_positions import build_lp_positions_json
+from c_parity.portfolio_cache import cached_sub_view
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LauncherViewerSnapshot:
     """
     JSON-kompatible Spiegelung der Launcher-/DEX-Sicht
@@ -40,8 +41,8 @@ def build_launcher_viewer_snapshot(
     Erzeugt einen reinen Lese-Snapshot der Launcher-/DEX-Sicht.
     Parität zur Struktur von ELTT-Viewer.c / ELTT-Viewer.json.
     """
-    tokens_json = build_token_positions_json(portfolio, max_tokens)
-    lp_json = build_lp_positions_json(portfolio, max_lp_positions)
+    tokens_json = cached_sub_view(build_token_positions_json, portfolio, max_tokens)
+    lp_json = cached_sub_view(build_lp_positions_json, portfolio, max_lp_positions)
 
     return LauncherViewerSnapshot(
         tokens=tokens_json,
@@ -13,9 +13,10 @@ from typing import Any, Dict, List, Mapping
 
 from c_parity.lp_positions import build_lp_positions_json
 from c_parity.stakingandpools import build_staking_and_pools_json
+from c_parity.portfolio_cache import cached_sub_view
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LiquidityPoolsViewerSnapshot:
     """
     JSON-kompatible Spiegelung der Liquidity-Pool-Sicht
@@ -40,8 +41,8 @@ def build_liquidity_pools_viewer_snapshot(
     Erzeugt einen reinen Lese-Snapshot der Liquidity-Pool-Sicht.
     Parität zur Struktur von ELTT-Viewer.c / ELTT-Viewer.json.
     """
-    lp_json = build_lp_positions_json(portfolio, max_lp_positions)
-    staking_json = build_staking_and_pools_json(portfolio, max_staking_and_pools)
+    lp_json = cached_sub_view(build_lp_positions_json, portfolio, max_lp_positions)
+    staking_json = cached_sub_view(build_staking_and_pools_json, portfolio, max_staking_and_pools)
 
     return LiquidityPoolsViewerSnapshot(
         lp_positions=lp_json,
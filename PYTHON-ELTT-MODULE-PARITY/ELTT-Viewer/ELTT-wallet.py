@@ -14,9 +14,10 @@ from typing import Any, Dict, List, Mapping
 from c_parity.tokens_positions import build_token_positions_json
 from c_parity.lp_positions import build_lp_positions_json
 from c_parity.stakingandpools import build_staking_and_pools_json
+from c_parity.portfolio_cache import cached_sub_view
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WalletViewerSnapshot:
     """
     JSON-kompatible Spiegelung der Wallet-Sicht
@@ -44,9 +45,9 @@ def build_wallet_viewer_snapshot(
     Erzeugt einen reinen Lese-Snapshot der Wallet-Sicht.
     Parität zur Struktur von ELTT-Viewer.c / ELTT-Viewer.json.
     """
-    tokens_json = build_token_positions_json(portfolio, max_tokens)
-    lp_json = build_lp_positions_json(portfolio, max_lp_positions)
-    staking_json = build_staking_and_pools_json(portfolio, max_staking_and_pools)
+    tokens_json = cached_sub_view(build_token_positions_json, portfolio, max_tokens)
+    lp_json = cached_sub_view(build_lp_positions_json, portfolio, max_lp_positions)
+    staking_json = cached_sub_view(build_staking_and_pools_json, portfolio, max_staking_and_pools)
 
     return WalletViewerSnapshot(
         tokens=tokens_json,
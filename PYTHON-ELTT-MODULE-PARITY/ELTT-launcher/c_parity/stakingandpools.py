@@ -10,14 +10,15 @@ Parität zu: eltt_viewer_build_staking_and_pools in ELTT-Viewer.c
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, List, Mapping, Sequence
+from operator import attrgetter
+from typing import Any, Dict, Iterator, List, Mapping, Sequence
 
 
 # ---------------------------------------------------------------------------
 # Datentypen – aggregierte Sicht auf Staking & Pools
 # ---------------------------------------------------------------------------
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StakingAndPoolsEntry:
     chain_id: int               # z.B. EVM-Chain-ID
     protocol: str               # Name/ID des Protokolls (z.B. "ELTT-POOL")
@@ -58,6 +59,38 @@ class StakingAndPoolsEntry:
 #
 # Es werden ausschließlich Lesezugriffe durchgeführt.
 
+# Alle acht Attribute in Eintragsreihenfolge in einem C-Level-Aufruf (EAFP).
+# Fehlt eines, werden die Pflichtattribute separat gelesen (AttributeError bleibt
+# erhalten) und die optionalen Beträge per getattr-Default ergänzt.
+_STAKING_ATTRS = attrgetter(
+    "chain_id", "protocol", "pool_address", "staked_token_symbol",
+    "staked_amount", "reward_token_symbol", "pending_rewards", "total_value",
+)
+_STAKING_REQUIRED = attrgetter(
+    "chain_id", "protocol", "pool_address", "staked_token_symbol", "reward_token_symbol"
+)
+
+
+def _staking_and_pools_entry(s: Any) -> StakingAndPoolsEntry:
+    try:
+        (chain_id, protocol, pool_address, staked_symbol,
+         staked_amount, reward_symbol, pending_rewards, total_value) = _STAKING_ATTRS(s)
+    except AttributeError:
+        chain_id, protocol, pool_address, staked_symbol, reward_symbol = _STAKING_REQUIRED(s)
+        staked_amount = getattr(s, "staked_amount", 0.0)
+        pending_rewards = getattr(s, "pending_rewards", 0.0)
+        total_value = getattr(s, "total_value", 0.0)
+    return StakingAndPoolsEntry(
+        int(chain_id),
+        str(protocol),
+        str(pool_address),
+        str(staked_symbol),
+        float(staked_amount),
+        str(reward_symbol),
+        float(pending_rewards),
+        float(total_value),
+    )
+
 
 def build_staking_and_pools(
     portfolio: Any,
@@ -74,21 +107,11 @@ def build_staking_and_pools(
     items: Sequence[Any] = getattr(portfolio, "staking_and_pools", [])
     count = min(len(items), max_entries)
 
-    entries: List[StakingAndPoolsEntry] = []
+    make = _staking_and_pools_entry
+    # Länge ist vorab bekannt: Liste einmalig anlegen statt per append wachsen lassen.
+    entries: List[StakingAndPoolsEntry] = [None] * count  # type: ignore[list-item]
     for i in range(count):
-        s = items[i]
-
-        entry = StakingAndPoolsEntry(
-            chain_id=int(getattr(s, "chain_id")),
-            protocol=str(getattr(s, "protocol")),
-            pool_address=str(getattr(s, "pool_address")),
-            staked_token_symbol=str(getattr(s, "staked_token_symbol")),
-            staked_amount=float(getattr(s, "staked_amount", 0.0)),
-            reward_token_symbol=str(getattr(s, "reward_token_symbol")),
-            pending_rewards=float(getattr(s, "pending_rewards", 0.0)),
-            total_value=float(getattr(s, "total_value", 0.0)),
-        )
-        entries.append(entry)
+        entries[i] = make(items[i])
 
     return entries
 
@@ -101,3 +124,17 @@ def build_staking_and_pools_json(
     JSON-kompatible Variante.
     """
     return [entry.to_json() for entry in build_staking_and_pools(portfolio, max_entries)]
+
+
+def iter_staking_and_pools_json(
+    portfolio: Any,
+    max_entries: int,
+) -> Iterator[Mapping[str, Any]]:
+    """
+    Wie build_staking_and_pools_json, liest jeden Eintrag jedoch erst beim
+    Iterieren (für streamende Serialisierung ohne Zwischenliste).
+    """
+    items: Sequence[Any] = getattr(portfolio, "staking_and_pools", [])
+    make = _staking_and_pools_entry
+    for i in range(min(len(items), max_entries)):
+        yield make(items[i]).to_json()
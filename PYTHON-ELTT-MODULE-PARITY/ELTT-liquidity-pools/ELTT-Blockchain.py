@@ -19,6 +19,7 @@ from ELTT-Blockchain import (  # type: ignore
     create_genesis,
     append_block,
     compute_tx_energy,
+    compute_tx_energy_batch,
     compute_block_hash,
 )
 
@@ -37,5 +38,6 @@ __all__ = [
     "create_genesis",
     "append_block",
     "compute_tx_energy",
+    "compute_tx_energy_batch",
     "compute_block_hash",
 ]
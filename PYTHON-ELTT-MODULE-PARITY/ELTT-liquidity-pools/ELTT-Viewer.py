@@ -10,16 +10,22 @@ Parität zur logischen Struktur von ELTT-Viewer.c / ELTT-Viewer.json
 
 from __future__ import annotations
 
+import json
 from dataclasses import dataclass
-from typing import Any, Dict, List, Mapping
+from typing import Any, Dict, Iterator, List, Mapping
 
-from c_parity.chaingrid import build_chain_grid_json
-from c_parity.tokens_positions import build_token_positions_json
-from c_parity.lp_positions import build_lp_positions_json
-from c_parity.stakingandpools import build_staking_and_pools_json
+from c_parity.chaingrid import build_chain_grid_json, iter_chain_grid_json
+from c_parity.tokens_positions import build_token_positions_json, iter_token_positions_json
+from c_parity.lp_positions import build_lp_positions_json, iter_lp_positions_json
+from c_parity.stakingandpools import build_staking_and_pools_json, iter_staking_and_pools_json
+from c_parity.portfolio_cache import cached_sub_view
 
+# Wiederverwendeter, kompakter Encoder für build_viewer_snapshot_bytes
+# (vermeidet pro Aufruf den Aufbau eines neuen JSONEncoder wie bei json.dumps).
+_SNAPSHOT_ENCODER = json.JSONEncoder(separators=(",", ":"))
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class ViewerSnapshot:
     """
     Logische Entsprechung der JSON-Struktur von ELTT-Viewer.json
@@ -51,10 +57,10 @@ def build_viewer_snapshot(
     ELTT-liquidity-pools-Modul.
     """
 
-    chains_json = build_chain_grid_json(portfolio, max_chains)
-    tokens_json = build_token_positions_json(portfolio, max_tokens)
-    lp_json = build_lp_positions_json(portfolio, max_lp_positions)
-    staking_json = build_staking_and_pools_json(portfolio, max_staking_and_pools)
+    chains_json = cached_sub_view(build_chain_grid_json, portfolio, max_chains)
+    tokens_json = cached_sub_view(build_token_positions_json, portfolio, max_tokens)
+    lp_json = cached_sub_view(build_lp_positions_json, portfolio, max_lp_positions)
+    staking_json = cached_sub_view(build_staking_and_pools_json, portfolio, max_staking_and_pools)
 
     return ViewerSnapshot(
         chains=chains_json,
@@ -83,3 +89,52 @@ def build_viewer_snapshot_json(
         max_staking_and_pools=max_staking_and_pools,
     )
     return snapshot.to_json()
+
+
+def build_viewer_snapshot_bytes(
+    portfolio: Any,
+    max_chains: int = 64,
+    max_tokens: int = 256,
+    max_lp_positions: int = 256,
+    max_staking_and_pools: int = 256,
+) -> bytes:
+    """
+    Wie build_viewer_snapshot_json, liefert jedoch direkt kompaktes JSON
+    (UTF-8) für Aufrufer, die das Ergebnis sonst durch json.dumps() reichen.
+    """
+    snapshot = build_viewer_snapshot(
+        portfolio=portfolio,
+        max_chains=max_chains,
+        max_tokens=max_tokens,
+        max_lp_positions=max_lp_positions,
+        max_staking_and_pools=max_staking_and_pools,
+    )
+    return _SNAPSHOT_ENCODER.encode(snapshot.to_json()).encode("utf-8")
+
+
+def iter_viewer_snapshot_json_chunks(
+    portfolio: Any,
+    max_chains: int = 64,
+    max_tokens: int = 256,
+    max_lp_positions: int = 256,
+    max_staking_and_pools: int = 256,
+) -> Iterator[bytes]:
+    """
+    Streamende Variante von build_viewer_snapshot_bytes:
+    Liefert dasselbe kompakte JSON stückweise (ein Chunk pro Eintrag bzw.
+    Trenner), ohne die vier Teil-Listen vorher vollständig aufzubauen.
+    """
+    encode = _SNAPSHOT_ENCODER.encode
+    sections = (
+        (b'{"chains":[', iter_chain_grid_json(portfolio, max_chains)),
+        (b'],"tokens":[', iter_token_positions_json(portfolio, max_tokens)),
+        (b'],"lp_positions":[', iter_lp_positions_json(portfolio, max_lp_positions)),
+        (b'],"staking_and_pools":[', iter_staking_and_pools_json(portfolio, max_staking_and_pools)),
+    )
+    for head, entries in sections:
+        yield head
+        sep = b""
+        for entry in entries:
+            yield sep + encode(entry).encode("utf-8")
+            sep = b","
+    yield b"]}"
@@ -15,6 +15,8 @@ from ELTT-Blockchain import (  # type: ignore
     compute_tx_energy,
 )
 
+from typing import Iterable
+
 
 def create_pool(bc: Blockchain,
                 token_x_index: int,
@@ -38,9 +40,13 @@ def get_pool(bc: Blockchain, pool_index: int) -> LiquidityPool | None:
     """
     Deterministischer Zugriff auf einen Liquidity-Pool.
     """
-    if pool_index < 0 or pool_index >= len(bc.pools):
+    # Negative Indizes würden von Python umgebrochen; die Obergrenze prüft der Zugriff.
+    if pool_index < 0:
+        return None
+    try:
+        return bc.pools[pool_index]
+    except IndexError:
         return None
-    return bc.pools[pool_index]
 
 
 def add_liquidity(bc: Blockchain,
@@ -67,12 +73,53 @@ def remove_liquidity(bc: Blockchain,
     pool = get_pool(bc, pool_index)
     if pool is None:
         return
-    pool.reserve_x -= share_x
-    pool.reserve_y -= share_y
-    if pool.reserve_x < 0.0:
-        pool.reserve_x = 0.0
-    if pool.reserve_y < 0.0:
-        pool.reserve_y = 0.0
+    # Untergrenze 0.0 auf lokalen Werten, je Reserve genau ein Attribut-Schreibzugriff.
+    reserve_x = pool.reserve_x - share_x
+    reserve_y = pool.reserve_y - share_y
+    pool.reserve_x = 0.0 if reserve_x < 0.0 else reserve_x
+    pool.reserve_y = 0.0 if reserve_y < 0.0 else reserve_y
+
+
+def add_liquidity_batch(bc: Blockchain,
+                        pool_indices: Iterable[int],
+                        amounts_x: Iterable[float],
+                        amounts_y: Iterable[float]) -> None:
+    """
+    Wendet add_liquidity für eine Folge von Ereignissen in Reihenfolge an.
+    Pool-Liste und Grenzen werden nur einmal pro Batch gebunden.
+    Ungleich lange Folgen lösen ValueError aus, bevor ein Pool verändert wird.
+    """
+    events = list(zip(pool_indices, amounts_x, amounts_y, strict=True))
+    pools = bc.pools
+    n = len(pools)
+    for pool_index, amount_x, amount_y in events:
+        if pool_index < 0 or pool_index >= n:
+            continue
+        pool = pools[pool_index]
+        pool.reserve_x += amount_x
+        pool.reserve_y += amount_y
+
+
+def remove_liquidity_batch(bc: Blockchain,
+                           pool_indices: Iterable[int],
+                           shares_x: Iterable[float],
+                           shares_y: Iterable[float]) -> None:
+    """
+    Wendet remove_liquidity für eine Folge von Ereignissen in Reihenfolge an
+    (Untergrenze 0.0 nach jedem Ereignis, wie im Einzelaufruf).
+    Ungleich lange Folgen lösen ValueError aus, bevor ein Pool verändert wird.
+    """
+    events = list(zip(pool_indices, shares_x, shares_y, strict=True))
+    pools = bc.pools
+    n = len(pools)
+    for pool_index, share_x, share_y in events:
+        if pool_index < 0 or pool_index >= n:
+            continue
+        pool = pools[pool_index]
+        reserve_x = pool.reserve_x - share_x
+        reserve_y = pool.reserve_y - share_y
+        pool.reserve_x = 0.0 if reserve_x < 0.0 else reserve_x
+        pool.reserve_y = 0.0 if reserve_y < 0.0 else reserve_y
 
 
 def build_add_liquidity_tx(from_address: str,
@@ -123,6 +170,8 @@ __all__ = [
     "get_pool",
     "add_liquidity",
     "remove_liquidity",
+    "add_liquidity_batch",
+    "remove_liquidity_batch",
     "build_add_liquidity_tx",
     "build_remove_liquidity_tx",
 ]
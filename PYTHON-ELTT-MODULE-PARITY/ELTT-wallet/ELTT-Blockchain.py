@@ -11,12 +11,13 @@ Dieses Modul speichert keine Seeds und keine privaten Schlüssel und erzeugt kei
 Genesis-Logik, sondern spiegelt nur einen bereits bestehenden Zustand.
 """
 
-from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional
-import copy
+from dataclasses import dataclass, field, fields, is_dataclass
+from operator import itemgetter
+from typing import List, Dict, Any, Optional, Sequence, Tuple
+import json
 
 
-@dataclass
+@dataclass(slots=True)
 class TransactionParity:
     tx_id: str
     from_address: str
@@ -28,7 +29,7 @@ class TransactionParity:
     energy: float
 
 
-@dataclass
+@dataclass(slots=True)
 class BlockParity:
     index: int
     timestamp: str
@@ -37,7 +38,7 @@ class BlockParity:
     transactions: List[TransactionParity] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class TokenTypeParity:
     index: int
     symbol: str
@@ -45,10 +46,100 @@ class TokenTypeParity:
     kind: str  # z.B. "NATIVE"
 
 
-@dataclass
+@dataclass(slots=True)
 class BlockchainStateParity:
-    blocks: List[BlockParity] = field(default_factory=list)
-    tokens: List[TokenTypeParity] = field(default_factory=list)
+    # Im Spiegel als Tupel eingefroren; get_*_state() liefert Listen-Kopien.
+    blocks: Sequence[BlockParity] = field(default_factory=list)
+    tokens: Sequence[TokenTypeParity] = field(default_factory=list)
+
+
+# Flache Kopien über den Konstruktor (wie dataclasses.replace, ohne dessen
+# Feld-Introspektion). Alle Felder sind Skalare, außer der Transaktionsliste.
+def _clone_tx(tx: TransactionParity) -> TransactionParity:
+    return TransactionParity(
+        tx.tx_id, tx.from_address, tx.to_address, tx.amount,
+        tx.token_index, tx.kind, tx.memo, tx.energy,
+    )
+
+
+def _clone_token(t: TokenTypeParity) -> TokenTypeParity:
+    return TokenTypeParity(t.index, t.symbol, t.name, t.kind)
+
+
+def _clone_block(b: BlockParity) -> BlockParity:
+    return BlockParity(
+        b.index, b.timestamp, b.prev_hash, b.hash,
+        [_clone_tx(tx) for tx in b.transactions],
+    )
+
+
+def _clone_state(state: BlockchainStateParity) -> BlockchainStateParity:
+    return BlockchainStateParity(
+        blocks=[_clone_block(b) for b in state.blocks],
+        tokens=[_clone_token(t) for t in state.tokens],
+    )
+
+
+def _tx_to_dict(tx: TransactionParity) -> Dict[str, Any]:
+    return {
+        "tx_id": tx.tx_id,
+        "from_address": tx.from_address,
+        "to_address": tx.to_address,
+        "amount": tx.amount,
+        "token_index": tx.token_index,
+        "kind": tx.kind,
+        "memo": tx.memo,
+        "energy": tx.energy,
+    }
+
+
+def _block_to_dict(b: BlockParity) -> Dict[str, Any]:
+    return {
+        "index": b.index,
+        "timestamp": b.timestamp,
+        "prev_hash": b.prev_hash,
+        "hash": b.hash,
+        "transactions": [_tx_to_dict(tx) for tx in b.transactions],
+    }
+
+
+def _token_to_dict(t: TokenTypeParity) -> Dict[str, Any]:
+    return {
+        "index": t.index,
+        "symbol": t.symbol,
+        "name": t.name,
+        "kind": t.kind,
+    }
+
+
+# Rohschlüssel je Datensatz in Konstruktor-Reihenfolge: ein itemgetter-Aufruf
+# liest alle auf C-Ebene; fehlt einer, gilt wie bisher dict.get (None).
+# Nur für exakte dicts: bei Unterklassen mit __missing__ (z.B. defaultdict)
+# würde der Zugriff Schlüssel in die Eingabe des Aufrufers einfügen.
+_BLOCK_KEYS = ("index", "timestamp", "prev_hash", "hash")
+_BLOCK_FIELDS = itemgetter(*_BLOCK_KEYS)
+_TX_KEYS = (
+    "tx_id", "from_address", "to_address", "amount",
+    "token_index", "kind", "memo", "energy",
+)
+_TX_FIELDS = itemgetter(*_TX_KEYS)
+_TOKEN_KEYS = ("index", "symbol", "name", "kind")
+_TOKEN_FIELDS = itemgetter(*_TOKEN_KEYS)
+
+
+# Feldnamen je Dataclass-Typ, einmalig aus dataclasses.fields() ermittelt.
+_JSON_FIELD_NAMES: Dict[type, Tuple[str, ...]] = {}
+
+
+def _parity_json_default(o: Any) -> Dict[str, Any]:
+    # json.dumps-Hook: Paritäts-Dataclasses werden direkt beim Kodieren in
+    # Dicts gleicher Feldreihenfolge wie export_state() übersetzt.
+    names = _JSON_FIELD_NAMES.get(type(o))
+    if names is None:
+        if not is_dataclass(o):
+            raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+        names = _JSON_FIELD_NAMES[type(o)] = tuple(f.name for f in fields(o))
+    return {name: getattr(o, name) for name in names}
 
 
 class ELTTBlockchainParityForWallet:
@@ -59,6 +150,24 @@ class ELTTBlockchainParityForWallet:
 
     def __init__(self) -> None:
         self._state: BlockchainStateParity = BlockchainStateParity()
+        self._block_by_index: Dict[int, BlockParity] = {}
+        self._token_by_index: Dict[int, TokenTypeParity] = {}
+        self._version: int = 0
+        self._state_json: Optional[Tuple[int, str]] = None
+
+    def _reindex(self) -> None:
+        # Erster Treffer je Index gewinnt, wie bei der linearen Suche.
+        block_by_index: Dict[int, BlockParity] = {}
+        for b in self._state.blocks:
+            block_by_index.setdefault(b.index, b)
+        token_by_index: Dict[int, TokenTypeParity] = {}
+        for t in self._state.tokens:
+            token_by_index.setdefault(t.index, t)
+        self._block_by_index = block_by_index
+        self._token_by_index = token_by_index
+        # Jeder Zustandswechsel (set_*_state / import_state) läuft hier durch;
+        # der Zähler ist allein der Schlüssel des export_state_json-Caches.
+        self._version += 1
 
     # -------------------------------------------------------------------------
     # Zustand setzen / holen
@@ -69,13 +178,17 @@ class ELTTBlockchainParityForWallet:
         Setzt den vollständigen Blockchain-Zustand deterministisch.
         Erwartet eine bereits berechnete, vertrauenswürdige Spiegelung.
         """
-        self._state = copy.deepcopy(state)
+        self._state = BlockchainStateParity(
+            blocks=tuple([_clone_block(b) for b in state.blocks]),
+            tokens=tuple([_clone_token(t) for t in state.tokens]),
+        )
+        self._reindex()
 
     def get_blockchain_state(self) -> BlockchainStateParity:
         """
-        Liefert eine tiefe Kopie des aktuellen Blockchain-Zustands.
+        Liefert eine unabhängige Kopie des aktuellen Blockchain-Zustands.
         """
-        return copy.deepcopy(self._state)
+        return _clone_state(self._state)
 
     # -------------------------------------------------------------------------
     # Blöcke
@@ -85,16 +198,14 @@ class ELTTBlockchainParityForWallet:
         """
         Liefert einen Block anhand seines Index, falls vorhanden.
         """
-        for b in self._state.blocks:
-            if b.index == index:
-                return copy.deepcopy(b)
-        return None
+        b = self._block_by_index.get(index)
+        return None if b is None else _clone_block(b)
 
     def list_blocks(self) -> List[BlockParity]:
         """
         Liefert eine Liste aller Blöcke in deterministischer Reihenfolge.
         """
-        return copy.deepcopy(self._state.blocks)
+        return [_clone_block(b) for b in self._state.blocks]
 
     # -------------------------------------------------------------------------
     # Token-Typen
@@ -104,16 +215,14 @@ class ELTTBlockchainParityForWallet:
         """
         Liefert alle bekannten Token-Typen (TTTC, ELTT, ELTC, …).
         """
-        return copy.deepcopy(self._state.tokens)
+        return [_clone_token(t) for t in self._state.tokens]
 
     def get_token_type_by_index(self, index: int) -> Optional[TokenTypeParity]:
         """
         Liefert einen Token-Typ anhand seines Index.
         """
-        for t in self._state.tokens:
-            if t.index == index:
-                return copy.deepcopy(t)
-        return None
+        t = self._token_by_index.get(index)
+        return None if t is None else _clone_token(t)
 
     # -------------------------------------------------------------------------
     # Export / Import
@@ -124,45 +233,23 @@ class ELTTBlockchainParityForWallet:
         Exportiert den Blockchain-Zustand deterministisch.
         Enthält keine Seeds, keine privaten Schlüssel und keine Genesis-Logik.
         """
-        data: Dict[str, Any] = {
-            "blocks": [],
-            "tokens": [],
+        state = self._state
+        return {
+            "blocks": [_block_to_dict(b) for b in state.blocks],
+            "tokens": [_token_to_dict(t) for t in state.tokens],
         }
 
-        for b in self._state.blocks:
-            data["blocks"].append(
-                {
-                    "index": b.index,
-                    "timestamp": b.timestamp,
-                    "prev_hash": b.prev_hash,
-                    "hash": b.hash,
-                    "transactions": [
-                        {
-                            "tx_id": tx.tx_id,
-                            "from_address": tx.from_address,
-                            "to_address": tx.to_address,
-                            "amount": tx.amount,
-                            "token_index": tx.token_index,
-                            "kind": tx.kind,
-                            "memo": tx.memo,
-                            "energy": tx.energy,
-                        }
-                        for tx in b.transactions
-                    ],
-                }
-            )
-
-        for t in self._state.tokens:
-            data["tokens"].append(
-                {
-                    "index": t.index,
-                    "symbol": t.symbol,
-                    "name": t.name,
-                    "kind": t.kind,
-                }
-            )
-
-        return data
+    def export_state_json(self) -> str:
+        """
+        Wie json.dumps(export_state()), ohne den Export vorab als Dict-Baum
+        aufzubauen: der Encoder läuft direkt über den gespiegelten Zustand.
+        """
+        cached = self._state_json
+        if cached is not None and cached[0] == self._version:
+            return cached[1]
+        text = json.dumps(self._state, default=_parity_json_default)
+        self._state_json = (self._version, text)
+        return text
 
     def import_state(self, data: Dict[str, Any]) -> None:
         """
@@ -178,27 +265,47 @@ class ELTTBlockchainParityForWallet:
         blocks: List[BlockParity] = []
         tokens: List[TokenTypeParity] = []
 
+        block_fields = _BLOCK_FIELDS
+        tx_fields = _TX_FIELDS
+
         for b in blocks_raw:
+            if type(b) is dict:
+                try:
+                    index, timestamp, prev_hash, hash_ = block_fields(b)
+                except KeyError:
+                    index, timestamp, prev_hash, hash_ = map(b.get, _BLOCK_KEYS)
+            else:
+                index, timestamp, prev_hash, hash_ = map(b.get, _BLOCK_KEYS)
             try:
-                index = int(b.get("index"))
-                timestamp = str(b.get("timestamp") or "")
-                prev_hash = str(b.get("prev_hash") or "")
-                hash_ = str(b.get("hash") or "")
+                index = int(index)
+                timestamp = str(timestamp or "")
+                prev_hash = str(prev_hash or "")
+                hash_ = str(hash_ or "")
             except (TypeError, ValueError):
                 continue
 
             txs_raw = b.get("transactions") or []
             txs: List[TransactionParity] = []
             for tx in txs_raw:
+                if type(tx) is dict:
+                    try:
+                        (tx_id, from_address, to_address, amount,
+                         token_index, kind, memo, energy) = tx_fields(tx)
+                    except KeyError:
+                        (tx_id, from_address, to_address, amount,
+                         token_index, kind, memo, energy) = map(tx.get, _TX_KEYS)
+                else:
+                    (tx_id, from_address, to_address, amount,
+                     token_index, kind, memo, energy) = map(tx.get, _TX_KEYS)
                 try:
-                    tx_id = str(tx.get("tx_id") or "")
-                    from_address = str(tx.get("from_address") or "")
-                    to_address = str(tx.get("to_address") or "")
-                    amount = float(tx.get("amount"))
-                    token_index = int(tx.get("token_index"))
-                    kind = str(tx.get("kind") or "")
-                    memo = str(tx.get("memo") or "")
-                    energy = float(tx.get("energy"))
+                    tx_id = str(tx_id or "")
+                    from_address = str(from_address or "")
+                    to_address = str(to_address or "")
+                    amount = float(amount)
+                    token_index = int(token_index)
+                    kind = str(kind or "")
+                    memo = str(memo or "")
+                    energy = float(energy)
                 except (TypeError, ValueError):
                     continue
                 txs.append(
@@ -224,12 +331,20 @@ class ELTTBlockchainParityForWallet:
                 )
             )
 
+        token_fields = _TOKEN_FIELDS
         for t in tokens_raw:
+            if type(t) is dict:
+                try:
+                    index, symbol, name, kind = token_fields(t)
+                except KeyError:
+                    index, symbol, name, kind = map(t.get, _TOKEN_KEYS)
+            else:
+                index, symbol, name, kind = map(t.get, _TOKEN_KEYS)
             try:
-                index = int(t.get("index"))
-                symbol = str(t.get("symbol") or "")
-                name = str(t.get("name") or "")
-                kind = str(t.get("kind") or "")
+                index = int(index)
+                symbol = str(symbol or "")
+                name = str(name or "")
+                kind = str(kind or "")
             except (TypeError, ValueError):
                 continue
             tokens.append(
@@ -241,7 +356,8 @@ class ELTTBlockchainParityForWallet:
                 )
             )
 
-        self._state = BlockchainStateParity(blocks=blocks, tokens=tokens)
+        self._state = BlockchainStateParity(blocks=tuple(blocks), tokens=tuple(tokens))
+        self._reindex()
 
 
 # Globale, paritätische Instanz für Wallet-bezogene Blockchain-Sicht
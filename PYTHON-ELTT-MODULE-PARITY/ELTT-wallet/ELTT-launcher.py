@@ -11,12 +11,13 @@ Dieses Modul speichert keine Seeds und keine privaten Schlüssel und erzeugt kei
 Genesis-Logik, sondern spiegelt nur einen bereits bestehenden Zustand.
 """
 
-from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional
-import copy
+from dataclasses import dataclass, field, fields, is_dataclass
+from operator import itemgetter
+from typing import List, Dict, Any, Optional, Sequence, Tuple
+import json
 
 
-@dataclass
+@dataclass(slots=True)
 class SwapRouteParity:
     route_id: str
     from_token_index: int
@@ -24,7 +25,7 @@ class SwapRouteParity:
     path: List[int]  # Liste von Token-Indizes, die den Swap-Pfad bilden
 
 
-@dataclass
+@dataclass(slots=True)
 class SwapQuoteParity:
     route_id: str
     input_token_index: int
@@ -34,9 +35,47 @@ class SwapQuoteParity:
     fee_amount: float
 
 
-@dataclass
+@dataclass(slots=True)
 class LauncherStateParity:
-    routes: List[SwapRouteParity] = field(default_factory=list)
+    # Im Spiegel als Tupel eingefroren; get_*_state() liefert Listen-Kopien.
+    routes: Sequence[SwapRouteParity] = field(default_factory=list)
+
+
+def _clone_route(r: SwapRouteParity) -> SwapRouteParity:
+    # Flache Kopie über den Konstruktor; der Pfad bekommt eine eigene Liste.
+    return SwapRouteParity(r.route_id, r.from_token_index, r.to_token_index, list(r.path))
+
+
+def _route_to_dict(r: SwapRouteParity) -> Dict[str, Any]:
+    return {
+        "route_id": r.route_id,
+        "from_token_index": r.from_token_index,
+        "to_token_index": r.to_token_index,
+        "path": list(r.path),
+    }
+
+
+# Rohschlüssel je Datensatz in Konstruktor-Reihenfolge: ein itemgetter-Aufruf
+# liest alle auf C-Ebene; fehlt einer, gilt wie bisher dict.get (None).
+# Nur für exakte dicts: bei Unterklassen mit __missing__ (z.B. defaultdict)
+# würde der Zugriff Schlüssel in die Eingabe des Aufrufers einfügen.
+_ROUTE_KEYS = ("route_id", "from_token_index", "to_token_index", "path")
+_ROUTE_FIELDS = itemgetter(*_ROUTE_KEYS)
+
+
+# Feldnamen je Dataclass-Typ, einmalig aus dataclasses.fields() ermittelt.
+_JSON_FIELD_NAMES: Dict[type, Tuple[str, ...]] = {}
+
+
+def _parity_json_default(o: Any) -> Dict[str, Any]:
+    # json.dumps-Hook: Paritäts-Dataclasses werden direkt beim Kodieren in
+    # Dicts gleicher Feldreihenfolge wie export_state() übersetzt.
+    names = _JSON_FIELD_NAMES.get(type(o))
+    if names is None:
+        if not is_dataclass(o):
+            raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+        names = _JSON_FIELD_NAMES[type(o)] = tuple(f.name for f in fields(o))
+    return {name: getattr(o, name) for name in names}
 
 
 class ELTTLauncherParityForWallet:
@@ -47,6 +86,25 @@ class ELTTLauncherParityForWallet:
 
     def __init__(self) -> None:
         self._state: LauncherStateParity = LauncherStateParity()
+        self._route_by_id: Dict[str, SwapRouteParity] = {}
+        self._routes_by_pair: Dict[Tuple[int, int], List[SwapRouteParity]] = {}
+        self._version: int = 0
+        self._state_json: Optional[Tuple[int, str]] = None
+
+    def _reindex(self) -> None:
+        # Erster Treffer je ID gewinnt, wie bei der linearen Suche.
+        route_by_id: Dict[str, SwapRouteParity] = {}
+        for r in self._state.routes:
+            route_by_id.setdefault(r.route_id, r)
+        self._route_by_id = route_by_id
+        # Routen je (from, to)-Paar in ursprünglicher Reihenfolge.
+        routes_by_pair: Dict[Tuple[int, int], List[SwapRouteParity]] = {}
+        for r in self._state.routes:
+            routes_by_pair.setdefault((r.from_token_index, r.to_token_index), []).append(r)
+        self._routes_by_pair = routes_by_pair
+        # Jeder Zustandswechsel (set_*_state / import_state) läuft hier durch;
+        # der Zähler ist allein der Schlüssel des export_state_json-Caches.
+        self._version += 1
 
     # -------------------------------------------------------------------------
     # Zustand setzen / holen
@@ -57,13 +115,14 @@ class ELTTLauncherParityForWallet:
         Setzt den vollständigen Launcher-/DEX-Zustand deterministisch.
         Erwartet eine bereits berechnete, vertrauenswürdige Spiegelung.
         """
-        self._state = copy.deepcopy(state)
+        self._state = LauncherStateParity(routes=tuple([_clone_route(r) for r in state.routes]))
+        self._reindex()
 
     def get_launcher_state(self) -> LauncherStateParity:
         """
-        Liefert eine tiefe Kopie des aktuellen Launcher-/DEX-Zustands.
+        Liefert eine unabhängige Kopie des aktuellen Launcher-/DEX-Zustands.
         """
-        return copy.deepcopy(self._state)
+        return LauncherStateParity(routes=[_clone_route(r) for r in self._state.routes])
 
     # -------------------------------------------------------------------------
     # Routen
@@ -73,7 +132,7 @@ class ELTTLauncherParityForWallet:
         """
         Liefert alle bekannten Swap-Routen.
         """
-        return copy.deepcopy(self._state.routes)
+        return [_clone_route(r) for r in self._state.routes]
 
     def get_route_by_id(self, route_id: str) -> Optional[SwapRouteParity]:
         """
@@ -82,20 +141,15 @@ class ELTTLauncherParityForWallet:
         rid = (route_id or "").strip()
         if not rid:
             return None
-        for r in self._state.routes:
-            if r.route_id == rid:
-                return copy.deepcopy(r)
-        return None
+        r = self._route_by_id.get(rid)
+        return None if r is None else _clone_route(r)
 
     def find_routes_for_pair(self, from_token_index: int, to_token_index: int) -> List[SwapRouteParity]:
         """
         Liefert alle Routen, die von einem Token zu einem anderen führen.
         """
-        result: List[SwapRouteParity] = []
-        for r in self._state.routes:
-            if r.from_token_index == from_token_index and r.to_token_index == to_token_index:
-                result.append(copy.deepcopy(r))
-        return result
+        routes = self._routes_by_pair.get((from_token_index, to_token_index), ())
+        return [_clone_route(r) for r in routes]
 
     # -------------------------------------------------------------------------
     # Quotes (Spiegelung)
@@ -130,21 +184,21 @@ class ELTTLauncherParityForWallet:
         Exportiert den Launcher-/DEX-Zustand deterministisch.
         Enthält keine Seeds, keine privaten Schlüssel und keine Genesis-Logik.
         """
-        data: Dict[str, Any] = {
-            "routes": [],
+        return {
+            "routes": [_route_to_dict(r) for r in self._state.routes],
         }
 
-        for r in self._state.routes:
-            data["routes"].append(
-                {
-                    "route_id": r.route_id,
-                    "from_token_index": r.from_token_index,
-                    "to_token_index": r.to_token_index,
-                    "path": list(r.path),
-                }
-            )
-
-        return data
+    def export_state_json(self) -> str:
+        """
+        Wie json.dumps(export_state()), ohne den Export vorab als Dict-Baum
+        aufzubauen: der Encoder läuft direkt über den gespiegelten Zustand.
+        """
+        cached = self._state_json
+        if cached is not None and cached[0] == self._version:
+            return cached[1]
+        text = json.dumps(self._state, default=_parity_json_default)
+        self._state_json = (self._version, text)
+        return text
 
     def import_state(self, data: Dict[str, Any]) -> None:
         """
@@ -157,13 +211,20 @@ class ELTTLauncherParityForWallet:
         routes_raw = data.get("routes") or []
         routes: List[SwapRouteParity] = []
 
+        route_fields = _ROUTE_FIELDS
         for r in routes_raw:
+            if type(r) is dict:
+                try:
+                    route_id, from_token_index, to_token_index, path_raw = route_fields(r)
+                except KeyError:
+                    route_id, from_token_index, to_token_index, path_raw = map(r.get, _ROUTE_KEYS)
+            else:
+                route_id, from_token_index, to_token_index, path_raw = map(r.get, _ROUTE_KEYS)
             try:
-                route_id = str(r.get("route_id") or "")
-                from_token_index = int(r.get("from_token_index"))
-                to_token_index = int(r.get("to_token_index"))
-                path_raw = r.get("path") or []
-                path: List[int] = [int(x) for x in path_raw]
+                route_id = str(route_id or "")
+                from_token_index = int(from_token_index)
+                to_token_index = int(to_token_index)
+                path: List[int] = [int(x) for x in path_raw or []]
             except (TypeError, ValueError):
                 continue
             if not route_id:
@@ -177,7 +238,8 @@ class ELTTLauncherParityForWallet:
                 )
             )
 
-        self._state = LauncherStateParity(routes=routes)
+        self._state = LauncherStateParity(routes=tuple(routes))
+        self._reindex()
 
 
 # Globale, paritätische Instanz für Wallet-bezogene Launcher-/DEX-Sicht
@@ -11,12 +11,13 @@ Dieses Modul speichert keine Seeds und keine privaten Schlüssel und erzeugt kei
 Genesis-Logik, sondern spiegelt nur einen bereits bestehenden Zustand.
 """
 
-from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional
-import copy
+from dataclasses import dataclass, field, fields, is_dataclass
+from operator import itemgetter
+from typing import List, Dict, Any, Optional, Sequence, Tuple
+import json
 
 
-@dataclass
+@dataclass(slots=True)
 class LiquidityPoolParity:
     pool_id: str
     token_x_index: int
@@ -26,17 +27,77 @@ class LiquidityPoolParity:
     reserve_y: float
 
 
-@dataclass
+@dataclass(slots=True)
 class WalletLiquidityPositionParity:
     address: str
     pool_id: str
     lp_amount: float
 
 
-@dataclass
+@dataclass(slots=True)
 class LiquidityPoolsStateParity:
-    pools: List[LiquidityPoolParity] = field(default_factory=list)
-    positions: List[WalletLiquidityPositionParity] = field(default_factory=list)
+    # Im Spiegel als Tupel eingefroren; get_*_state() liefert Listen-Kopien.
+    pools: Sequence[LiquidityPoolParity] = field(default_factory=list)
+    positions: Sequence[WalletLiquidityPositionParity] = field(default_factory=list)
+
+
+# Flache Kopien über den Konstruktor (wie dataclasses.replace, ohne dessen
+# Feld-Introspektion); beide Typen enthalten nur Skalare.
+def _clone_pool(p: LiquidityPoolParity) -> LiquidityPoolParity:
+    return LiquidityPoolParity(
+        p.pool_id, p.token_x_index, p.token_y_index, p.lp_token_index,
+        p.reserve_x, p.reserve_y,
+    )
+
+
+def _clone_position(pos: WalletLiquidityPositionParity) -> WalletLiquidityPositionParity:
+    return WalletLiquidityPositionParity(pos.address, pos.pool_id, pos.lp_amount)
+
+
+def _pool_to_dict(p: LiquidityPoolParity) -> Dict[str, Any]:
+    return {
+        "pool_id": p.pool_id,
+        "token_x_index": p.token_x_index,
+        "token_y_index": p.token_y_index,
+        "lp_token_index": p.lp_token_index,
+        "reserve_x": p.reserve_x,
+        "reserve_y": p.reserve_y,
+    }
+
+
+def _position_to_dict(pos: WalletLiquidityPositionParity) -> Dict[str, Any]:
+    return {
+        "address": pos.address,
+        "pool_id": pos.pool_id,
+        "lp_amount": pos.lp_amount,
+    }
+
+
+# Rohschlüssel je Datensatz in Konstruktor-Reihenfolge: ein itemgetter-Aufruf
+# liest alle auf C-Ebene; fehlt einer, gilt wie bisher dict.get (None).
+# Nur für exakte dicts: bei Unterklassen mit __missing__ (z.B. defaultdict)
+# würde der Zugriff Schlüssel in die Eingabe des Aufrufers einfügen.
+_POOL_KEYS = (
+    "pool_id", "token_x_index", "token_y_index", "lp_token_index", "reserve_x", "reserve_y",
+)
+_POOL_FIELDS = itemgetter(*_POOL_KEYS)
+_POSITION_KEYS = ("address", "pool_id", "lp_amount")
+_POSITION_FIELDS = itemgetter(*_POSITION_KEYS)
+
+
+# Feldnamen je Dataclass-Typ, einmalig aus dataclasses.fields() ermittelt.
+_JSON_FIELD_NAMES: Dict[type, Tuple[str, ...]] = {}
+
+
+def _parity_json_default(o: Any) -> Dict[str, Any]:
+    # json.dumps-Hook: Paritäts-Dataclasses werden direkt beim Kodieren in
+    # Dicts gleicher Feldreihenfolge wie export_state() übersetzt.
+    names = _JSON_FIELD_NAMES.get(type(o))
+    if names is None:
+        if not is_dataclass(o):
+            raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+        names = _JSON_FIELD_NAMES[type(o)] = tuple(f.name for f in fields(o))
+    return {name: getattr(o, name) for name in names}
 
 
 class ELTTLiquidityPoolsParityForWallet:
@@ -47,6 +108,25 @@ class ELTTLiquidityPoolsParityForWallet:
 
     def __init__(self) -> None:
         self._state: LiquidityPoolsStateParity = LiquidityPoolsStateParity()
+        self._pool_by_id: Dict[str, LiquidityPoolParity] = {}
+        self._positions_by_address: Dict[str, List[WalletLiquidityPositionParity]] = {}
+        self._version: int = 0
+        self._state_json: Optional[Tuple[int, str]] = None
+
+    def _reindex(self) -> None:
+        # Erster Treffer je ID gewinnt, wie bei der linearen Suche.
+        pool_by_id: Dict[str, LiquidityPoolParity] = {}
+        for p in self._state.pools:
+            pool_by_id.setdefault(p.pool_id, p)
+        self._pool_by_id = pool_by_id
+        # Positionen je Adresse in ursprünglicher Reihenfolge.
+        positions_by_address: Dict[str, List[WalletLiquidityPositionParity]] = {}
+        for pos in self._state.positions:
+            positions_by_address.setdefault(pos.address, []).append(pos)
+        self._positions_by_address = positions_by_address
+        # Jeder Zustandswechsel (set_*_state / import_state) läuft hier durch;
+        # der Zähler ist allein der Schlüssel des export_state_json-Caches.
+        self._version += 1
 
     # -------------------------------------------------------------------------
     # Zustand setzen / holen
@@ -57,13 +137,21 @@ class ELTTLiquidityPoolsParityForWallet:
         Setzt den vollständigen Liquidity-Pool-Zustand deterministisch.
         Erwartet eine bereits berechnete, vertrauenswürdige Spiegelung.
         """
-        self._state = copy.deepcopy(state)
+        self._state = LiquidityPoolsStateParity(
+            pools=tuple([_clone_pool(p) for p in state.pools]),
+            positions=tuple([_clone_position(pos) for pos in state.positions]),
+        )
+        self._reindex()
 
     def get_liquidity_pools_state(self) -> LiquidityPoolsStateParity:
         """
-        Liefert eine tiefe Kopie des aktuellen Liquidity-Pool-Zustands.
+        Liefert eine unabhängige Kopie des aktuellen Liquidity-Pool-Zustands.
         """
-        return copy.deepcopy(self._state)
+        state = self._state
+        return LiquidityPoolsStateParity(
+            pools=[_clone_pool(p) for p in state.pools],
+            positions=[_clone_position(pos) for pos in state.positions],
+        )
 
     # -------------------------------------------------------------------------
     # Pools
@@ -73,7 +161,7 @@ class ELTTLiquidityPoolsParityForWallet:
         """
         Liefert alle bekannten Liquidity-Pools.
         """
-        return copy.deepcopy(self._state.pools)
+        return [_clone_pool(p) for p in self._state.pools]
 
     def get_pool_by_id(self, pool_id: str) -> Optional[LiquidityPoolParity]:
         """
@@ -82,10 +170,8 @@ class ELTTLiquidityPoolsParityForWallet:
         pid = (pool_id or "").strip()
         if not pid:
             return None
-        for p in self._state.pools:
-            if p.pool_id == pid:
-                return copy.deepcopy(p)
-        return None
+        p = self._pool_by_id.get(pid)
+        return None if p is None else _clone_pool(p)
 
     # -------------------------------------------------------------------------
     # Wallet-Positionen
@@ -98,17 +184,13 @@ class ELTTLiquidityPoolsParityForWallet:
         addr = (address or "").strip()
         if not addr:
             return []
-        result: List[WalletLiquidityPositionParity] = []
-        for pos in self._state.positions:
-            if pos.address == addr:
-                result.append(copy.deepcopy(pos))
-        return result
+        return [_clone_position(pos) for pos in self._positions_by_address.get(addr, ())]
 
     def list_all_positions(self) -> List[WalletLiquidityPositionParity]:
         """
         Liefert alle Liquidity-Positionen aller Adressen.
         """
-        return copy.deepcopy(self._state.positions)
+        return [_clone_position(pos) for pos in self._state.positions]
 
     # -------------------------------------------------------------------------
     # Export / Import
@@ -119,33 +201,23 @@ class ELTTLiquidityPoolsParityForWallet:
         Exportiert den Liquidity-Pool-Zustand deterministisch.
         Enthält keine Seeds, keine privaten Schlüssel und keine Genesis-Logik.
         """
-        data: Dict[str, Any] = {
-            "pools": [],
-            "positions": [],
+        state = self._state
+        return {
+            "pools": [_pool_to_dict(p) for p in state.pools],
+            "positions": [_position_to_dict(pos) for pos in state.positions],
         }
 
-        for p in self._state.pools:
-            data["pools"].append(
-                {
-                    "pool_id": p.pool_id,
-                    "token_x_index": p.token_x_index,
-                    "token_y_index": p.token_y_index,
-                    "lp_token_index": p.lp_token_index,
-                    "reserve_x": p.reserve_x,
-                    "reserve_y": p.reserve_y,
-                }
-            )
-
-        for pos in self._state.positions:
-            data["positions"].append(
-                {
-                    "address": pos.address,
-                    "pool_id": pos.pool_id,
-                    "lp_amount": pos.lp_amount,
-                }
-            )
-
-        return data
+    def export_state_json(self) -> str:
+        """
+        Wie json.dumps(export_state()), ohne den Export vorab als Dict-Baum
+        aufzubauen: der Encoder läuft direkt über den gespiegelten Zustand.
+        """
+        cached = self._state_json
+        if cached is not None and cached[0] == self._version:
+            return cached[1]
+        text = json.dumps(self._state, default=_parity_json_default)
+        self._state_json = (self._version, text)
+        return text
 
     def import_state(self, data: Dict[str, Any]) -> None:
         """
@@ -161,14 +233,25 @@ class ELTTLiquidityPoolsParityForWallet:
         pools: List[LiquidityPoolParity] = []
         positions: List[WalletLiquidityPositionParity] = []
 
+        pool_fields = _POOL_FIELDS
         for p in pools_raw:
+            if type(p) is dict:
+                try:
+                    (pool_id, token_x_index, token_y_index,
+                     lp_token_index, reserve_x, reserve_y) = pool_fields(p)
+                except KeyError:
+                    (pool_id, token_x_index, token_y_index,
+                     lp_token_index, reserve_x, reserve_y) = map(p.get, _POOL_KEYS)
+            else:
+                (pool_id, token_x_index, token_y_index,
+                 lp_token_index, reserve_x, reserve_y) = map(p.get, _POOL_KEYS)
             try:
-                pool_id = str(p.get("pool_id") or "")
-                token_x_index = int(p.get("token_x_index"))
-                token_y_index = int(p.get("token_y_index"))
-                lp_token_index = int(p.get("lp_token_index"))
-                reserve_x = float(p.get("reserve_x"))
-                reserve_y = float(p.get("reserve_y"))
+                pool_id = str(pool_id or "")
+                token_x_index = int(token_x_index)
+                token_y_index = int(token_y_index)
+                lp_token_index = int(lp_token_index)
+                reserve_x = float(reserve_x)
+                reserve_y = float(reserve_y)
             except (TypeError, ValueError):
                 continue
             if not pool_id:
@@ -184,11 +267,19 @@ class ELTTLiquidityPoolsParityForWallet:
                 )
             )
 
+        position_fields = _POSITION_FIELDS
         for pos in positions_raw:
+            if type(pos) is dict:
+                try:
+                    address, pool_id, lp_amount = position_fields(pos)
+                except KeyError:
+                    address, pool_id, lp_amount = map(pos.get, _POSITION_KEYS)
+            else:
+                address, pool_id, lp_amount = map(pos.get, _POSITION_KEYS)
             try:
-                address = str(pos.get("address") or "")
-                pool_id = str(pos.get("pool_id") or "")
-                lp_amount = float(pos.get("lp_amount"))
+                address = str(address or "")
+                pool_id = str(pool_id or "")
+                lp_amount = float(lp_amount)
             except (TypeError, ValueError):
                 continue
             if not address or not pool_id:
@@ -201,7 +292,8 @@ class ELTTLiquidityPoolsParityForWallet:
                 )
             )
 
-        self._state = LiquidityPoolsStateParity(pools=pools, positions=positions)
+        self._state = LiquidityPoolsStateParity(pools=tuple(pools), positions=tuple(positions))
+        self._reindex()
 
 
 # Globale, paritätische Instanz für Wallet-bezogene Liquidity-Pool-Sicht
@@ -8,23 +8,61 @@ besitzt TTTC, ELTT und ELTC, erzeugt Block 2 autonom und ist Ursprung aller Exte
 Dieses Modul speichert keine Seeds und keine privaten Schlüssel.
 """
 
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any
-import copy
+from dataclasses import dataclass, field, fields, is_dataclass
+from typing import Dict, Iterator, List, Optional, Any, Tuple
+import json
+import sys
 
 
-@dataclass
+@dataclass(slots=True)
 class TokenBalance:
     token_index: int
     symbol: str
     amount: float
 
+    # Tupel-Zustand für pickle/copy statt der generischen Slot-Helfer der Dataclass.
+    def __getstate__(self) -> Tuple[int, str, float]:
+        return (self.token_index, self.symbol, self.amount)
 
-@dataclass
+    def __setstate__(self, state: Tuple[int, str, float]) -> None:
+        self.token_index, self.symbol, self.amount = state
+
+
+@dataclass(slots=True)
 class WalletState:
     address: str
     balances: List[TokenBalance] = field(default_factory=list)
 
+    def __getstate__(self) -> Tuple[str, List[TokenBalance]]:
+        return (self.address, self.balances)
+
+    def __setstate__(self, state: Tuple[str, List[TokenBalance]]) -> None:
+        self.address, self.balances = state
+
+
+def _clone_balances(balances: List[TokenBalance]) -> List[TokenBalance]:
+    # Flache Kopie je Eintrag über den Konstruktor; alle Felder sind Skalare.
+    return [TokenBalance(b.token_index, b.symbol, b.amount) for b in balances]
+
+
+# Feldnamen je Dataclass-Typ, einmalig aus dataclasses.fields() ermittelt.
+_JSON_FIELD_NAMES: Dict[type, Tuple[str, ...]] = {}
+
+
+def _parity_json_default(o: Any) -> Dict[str, Any]:
+    # json.dumps-Hook: Paritäts-Dataclasses werden direkt beim Kodieren in
+    # Dicts gleicher Feldreihenfolge wie export_state() übersetzt.
+    names = _JSON_FIELD_NAMES.get(type(o))
+    if names is None:
+        if not is_dataclass(o):
+            raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+        names = _JSON_FIELD_NAMES[type(o)] = tuple(f.name for f in fields(o))
+    return {name: getattr(o, name) for name in names}
+
+
+# Einmalig angelegter Encoder für den streamenden Export (gleiche Trenner wie json.dumps).
+_EXPORT_ENCODER = json.JSONEncoder(default=_parity_json_default)
+
 
 class ELTTWalletParity:
     """
@@ -51,7 +89,7 @@ class ELTTWalletParity:
             return
         self._current_address = addr
         if addr not in self._wallets:
-            self._wallets[addr] = WalletState(address=addr, balances=[])
+            self._wallets[addr] = WalletState(address=addr)
 
     def get_current_wallet_address(self) -> Optional[str]:
         """
@@ -74,7 +112,7 @@ class ELTTWalletParity:
         state = self._wallets.get(addr)
         if state is None:
             return None
-        return copy.deepcopy(state)
+        return WalletState(state.address, _clone_balances(state.balances))
 
     def set_wallet_balances(self, address: str, balances: List[TokenBalance]) -> None:
         """
@@ -84,7 +122,7 @@ class ELTTWalletParity:
         addr = (address or "").strip()
         if not addr:
             return
-        self._wallets[addr] = WalletState(address=addr, balances=copy.deepcopy(balances))
+        self._wallets[addr] = WalletState(address=addr, balances=_clone_balances(balances))
 
     # -------------------------------------------------------------------------
     # Export / Import
@@ -95,12 +133,9 @@ class ELTTWalletParity:
         Exportiert den vollständigen Wallet-Zustand deterministisch.
         Enthält keine Seeds, keine privaten Schlüssel und keine Genesis-Logik.
         """
-        data: Dict[str, Any] = {
-            "current_address": self._current_address,
-            "wallets": {},
-        }
+        wallets: Dict[str, Any] = {}
         for addr, state in self._wallets.items():
-            data["wallets"][addr] = {
+            wallets[addr] = {
                 "address": state.address,
                 "balances": [
                     {
@@ -111,7 +146,33 @@ class ELTTWalletParity:
                     for b in state.balances
                 ],
             }
-        return data
+        return {
+            "current_address": self._current_address,
+            "wallets": wallets,
+        }
+
+    def export_state_json(self) -> str:
+        """
+        Wie json.dumps(export_state()), ohne den Export vorab als Dict-Baum
+        aufzubauen: der Encoder läuft direkt über die gespiegelten Wallets.
+        """
+        return json.dumps(
+            {"current_address": self._current_address, "wallets": self._wallets},
+            default=_parity_json_default,
+        )
+
+    def iter_export_state_json(self) -> Iterator[bytes]:
+        """
+        Streamende Variante von export_state_json: liefert dasselbe JSON als
+        UTF-8-Chunks, eine Wallet pro Chunk, ohne den Gesamttext aufzubauen.
+        """
+        encode = _EXPORT_ENCODER.encode
+        yield b'{"current_address": ' + encode(self._current_address).encode("utf-8") + b', "wallets": {'
+        sep = b""
+        for addr, state in self._wallets.items():
+            yield sep + encode(addr).encode("utf-8") + b": " + encode(state).encode("utf-8")
+            sep = b", "
+        yield b"}}"
 
     def import_state(self, data: Dict[str, Any]) -> None:
         """
@@ -127,21 +188,26 @@ class ELTTWalletParity:
         wallets_raw = data.get("wallets") or {}
         self._wallets.clear()
 
+        # Symbole wiederholen sich über alle Wallets: eine gemeinsame Instanz je Symbol.
+        intern = sys.intern
+        balance_type = TokenBalance
+        wallets = self._wallets
         for addr, w in wallets_raw.items():
             address = (w.get("address") or "").strip()
             if not address:
                 continue
             balances_raw = w.get("balances") or []
             balances: List[TokenBalance] = []
+            append = balances.append
             for b in balances_raw:
                 try:
                     token_index = int(b.get("token_index"))
-                    symbol = str(b.get("symbol") or "").strip()
+                    symbol = intern(str(b.get("symbol") or "").strip())
                     amount = float(b.get("amount"))
                 except (TypeError, ValueError):
                     continue
-                balances.append(TokenBalance(token_index=token_index, symbol=symbol, amount=amount))
-            self._wallets[address] = WalletState(address=address, balances=balances)
+                append(balance_type(token_index, symbol, amount))
+            wallets[address] = WalletState(address, balances)
 
 
 # Globale, paritätische Instanz
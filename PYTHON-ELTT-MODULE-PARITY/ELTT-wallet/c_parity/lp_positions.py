@@ -10,14 +10,15 @@ Parität zu: eltt_viewer_build_lp_positions in ELTT-Viewer.c
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, List, Mapping, Sequence
+from operator import attrgetter
+from typing import Any, Dict, Iterator, List, Mapping, Sequence
 
 
 # ---------------------------------------------------------------------------
 # Datentypen – Parität zu "LP-Position"-Einträgen im C-Viewer
 # ---------------------------------------------------------------------------
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LPPositionEntry:
     chain_id: int              # z.B. EVM-Chain-ID
     pool_address: str          # Adresse des Pools (hex-String)
@@ -45,25 +46,42 @@ class LPPositionEntry:
 # Erwartete Portfolio-/State-Schnittstelle (read-only)
 # ---------------------------------------------------------------------------
 
+# Pflichtattribute in einem C-Level-Aufruf. Optionale Beträge ebenfalls in einem
+# Aufruf (EAFP); nur wenn eines fehlt, greifen die getattr-Defaults.
+_LP_REQUIRED = attrgetter("chain_id", "pool_address", "token0_symbol", "token1_symbol")
+_LP_AMOUNTS = attrgetter("share_percent", "amount_token0", "amount_token1", "total_value")
+
+
+def _lp_position_entry(p: Any) -> LPPositionEntry:
+    chain_id, pool_address, token0_symbol, token1_symbol = _LP_REQUIRED(p)
+    try:
+        share_percent, amount_token0, amount_token1, total_value = _LP_AMOUNTS(p)
+    except AttributeError:
+        share_percent = getattr(p, "share_percent", 0.0)
+        amount_token0 = getattr(p, "amount_token0", 0.0)
+        amount_token1 = getattr(p, "amount_token1", 0.0)
+        total_value = getattr(p, "total_value", 0.0)
+    return LPPositionEntry(
+        int(chain_id),
+        str(pool_address),
+        str(token0_symbol),
+        str(token1_symbol),
+        float(share_percent),
+        float(amount_token0),
+        float(amount_token1),
+        float(total_value),
+    )
+
+
 def build_lp_positions(portfolio: Any, max_entries: int) -> List[LPPositionEntry]:
     lp_positions: Sequence[Any] = getattr(portfolio, "lp_positions", [])
     count = min(len(lp_positions), max_entries)
 
-    entries: List[LPPositionEntry] = []
+    make = _lp_position_entry
+    # Länge ist vorab bekannt: Liste einmalig anlegen statt per append wachsen lassen.
+    entries: List[LPPositionEntry] = [None] * count  # type: ignore[list-item]
     for i in range(count):
-        p = lp_positions[i]
-
-        entry = LPPositionEntry(
-            chain_id=int(getattr(p, "chain_id")),
-            pool_address=str(getattr(p, "pool_address")),
-            token0_symbol=str(getattr(p, "token0_symbol")),
-            token1_symbol=str(getattr(p, "token1_symbol")),
-            share_percent=float(getattr(p, "share_percent", 0.0)),
-            amount_token0=float(getattr(p, "amount_token0", 0.0)),
-            amount_token1=float(getattr(p, "amount_token1", 0.0)),
-            total_value=float(getattr(p, "total_value", 0.0)),
-        )
-        entries.append(entry)
+        entries[i] = make(lp_positions[i])
 
     return entries
 
@@ -73,3 +91,17 @@ def build_lp_positions_json(
     max_entries: int,
 ) -> List[Mapping[str, Any]]:
     return [entry.to_json() for entry in build_lp_positions(portfolio, max_entries)]
+
+
+def iter_lp_positions_json(
+    portfolio: Any,
+    max_entries: int,
+) -> Iterator[Mapping[str, Any]]:
+    """
+    Wie build_lp_positions_json, liest jede Position jedoch erst beim Iterieren
+    (für streamende Serialisierung ohne Zwischenliste).
+    """
+    lp_positions: Sequence[Any] = getattr(portfolio, "lp_positions", [])
+    make = _lp_position_entry
+    for i in range(min(len(lp_positions), max_entries)):
+        yield make(lp_positions[i]).to_json()
@@ -0,0 +1,60 @@
+"""
+PYTHON-ELTT-MODULE-PARITY/ELTT-Viewer/c_parity/portfolio_cache.py
+
+Gemeinsamer Cache für Teil-Sichten (build_*_json) über alle Viewer-Snapshots
+- reine Lese-Sicht, keine Mutationen am Portfolio
+- Schlüssel: (Builder, id(portfolio), portfolio._eltt_version, max_entries)
+- nur Portfolios mit explizitem `_eltt_version`-Attribut werden gecacht
+  (ein beliebiges `version`-Attribut zählt nicht als Opt-in)
+- jeder Aufruf erhält eine eigene Liste mit eigenen Eintrags-Dicts
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Any, Callable, List, Mapping, Tuple
+
+
+SubViewBuilder = Callable[[Any, int], List[Mapping[str, Any]]]
+
+# LRU über alle Builder: Wallet-, Launcher-, Liquidity- und Master-Sicht eines
+# Ticks teilen sich dieselben Token-/LP-/Staking-Listen. Die Referenz auf das
+# Portfolio im Eintrag schließt Treffer auf wiederverwendete ids aus.
+_CACHE_MAX = 32
+_cache: "OrderedDict[Tuple[SubViewBuilder, int, Any, int], Tuple[Any, List[Mapping[str, Any]]]]" = OrderedDict()
+
+
+def cached_sub_view(
+    builder: SubViewBuilder,
+    portfolio: Any,
+    max_entries: int,
+) -> List[Mapping[str, Any]]:
+    """
+    Liefert builder(portfolio, max_entries), bei unveränderter
+    portfolio._eltt_version aus dem Cache.
+
+    Die Einträge der Builder sind flache Dicts mit unveränderlichen Werten;
+    ein flaches dict() je Eintrag genügt, damit Änderungen am Ergebnis
+    weder den Cache noch andere Snapshots erreichen.
+    """
+    version = getattr(portfolio, "_eltt_version", None)
+    if version is None:
+        return builder(portfolio, max_entries)
+    key = (builder, id(portfolio), version, max_entries)
+    hit = _cache.get(key)
+    if hit is not None and hit[0] is portfolio:
+        _cache.move_to_end(key)
+        entries = hit[1]
+    else:
+        entries = builder(portfolio, max_entries)
+        _cache[key] = (portfolio, entries)
+        if len(_cache) > _CACHE_MAX:
+            _cache.popitem(last=False)
+    return [dict(entry) for entry in entries]
+
+
+def clear_sub_view_cache() -> None:
+    """
+    Verwirft alle gecachten Teil-Sichten.
+    """
+    _cache.clear()
@@ -9,15 +9,17 @@ Parität zu: eltt_viewer_build_token_positions in ELTT-Viewer.c
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
-from typing import Any, Dict, List, Mapping, Sequence
+from operator import attrgetter
+from typing import Any, Dict, Iterator, List, Mapping, Sequence
 
 
 # ---------------------------------------------------------------------------
 # Datentypen – Parität zu "Token-Position"-Einträgen im C-Viewer
 # ---------------------------------------------------------------------------
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TokenPositionEntry:
     chain_id: int              # z.B. EVM-Chain-ID
     token_address: str         # kanonische Adresse (hex-String)
@@ -57,6 +59,34 @@ class TokenPositionEntry:
 #
 # Es werden ausschließlich Lesezugriffe durchgeführt.
 
+# Pflichtattribute in einem C-Level-Aufruf. Optionale Salden ebenfalls in einem
+# Aufruf (EAFP); nur wenn einer fehlt, greifen die getattr-Defaults.
+_TOKEN_REQUIRED = attrgetter("chain_id", "address", "symbol", "decimals")
+_TOKEN_BALANCES = attrgetter("wallet_balance", "pool_balance")
+
+
+def _token_position_entry(t: Any) -> TokenPositionEntry:
+    try:
+        wallet_balance, pool_balance = _TOKEN_BALANCES(t)
+    except AttributeError:
+        wallet_balance = getattr(t, "wallet_balance", 0.0)
+        pool_balance = getattr(t, "pool_balance", 0.0)
+    wallet_balance = float(wallet_balance)
+    pool_balance = float(pool_balance)
+    chain_id, address, symbol, decimals = _TOKEN_REQUIRED(t)
+
+    # Symbole/Adressen wiederholen sich über viele Einträge: ein Objekt je Wert.
+    intern = sys.intern
+    return TokenPositionEntry(
+        int(chain_id),
+        intern(str(address)),
+        intern(str(symbol)),
+        int(decimals),
+        wallet_balance,
+        pool_balance,
+        wallet_balance + pool_balance,
+    )
+
 
 def build_token_positions(portfolio: Any, max_entries: int) -> List[TokenPositionEntry]:
     """
@@ -70,24 +100,11 @@ def build_token_positions(portfolio: Any, max_entries: int) -> List[TokenPositio
     tokens: Sequence[Any] = getattr(portfolio, "tokens", [])
     count = min(len(tokens), max_entries)
 
-    entries: List[TokenPositionEntry] = []
+    make = _token_position_entry
+    # Länge ist vorab bekannt: Liste einmalig anlegen statt per append wachsen lassen.
+    entries: List[TokenPositionEntry] = [None] * count  # type: ignore[list-item]
     for i in range(count):
-        t = tokens[i]
-
-        wallet_balance = float(getattr(t, "wallet_balance", 0.0))
-        pool_balance = float(getattr(t, "pool_balance", 0.0))
-        total_balance = wallet_balance + pool_balance
-
-        entry = TokenPositionEntry(
-            chain_id=int(getattr(t, "chain_id")),
-            token_address=str(getattr(t, "address")),
-            symbol=str(getattr(t, "symbol")),
-            decimals=int(getattr(t, "decimals")),
-            wallet_balance=wallet_balance,
-            pool_balance=pool_balance,
-            total_balance=total_balance,
-        )
-        entries.append(entry)
+        entries[i] = make(tokens[i])
 
     return entries
 
@@ -100,3 +117,17 @@ def build_token_positions_json(
     JSON-kompatible Variante.
     """
     return [entry.to_json() for entry in build_token_positions(portfolio, max_entries)]
+
+
+def iter_token_positions_json(
+    portfolio: Any,
+    max_entries: int,
+) -> Iterator[Mapping[str, Any]]:
+    """
+    Wie build_token_positions_json, liest jeden Token jedoch erst beim Iterieren
+    (für streamende Serialisierung ohne Zwischenliste).
+    """
+    tokens: Sequence[Any] = getattr(portfolio, "tokens", [])
+    make = _token_position_entry
+    for i in range(min(len(tokens), max_entries)):
+        yield make(tokens[i]).to_json()